@@ -0,0 +1,56 @@
+import argparse
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+import requests
+
+
+def add_directory_argument(parser: argparse.ArgumentParser):
+    """
+    Adds the argument for reading ddragon data files from a directory
+    """
+
+    parser.add_argument(
+        "--directory",
+        type=Path,
+        help="directory of ddragon data files to use instead of downloading "
+        "the current patch's (e.g. tests/fixtures/ddragon)",
+    )
+
+
+def read_ddragon_file(filename: str, directory: Optional[Path] = None) -> bytes:
+    """
+    Returns the contents of a ddragon data file
+
+    filename - name of ddragon data file (e.g. "item.json")
+    directory - directory to read the file from, None to download it
+        for the current patch
+    """
+
+    if directory is not None:
+        return (directory / filename).read_bytes()
+
+    from puppy.apis.ddragon import Patches
+    from puppy.apis.ddragon.cache import DATA_URL
+
+    patch = Patches.get_current_patch()
+    r = requests.get(DATA_URL.format(patch=patch, filename=filename))
+    r.raise_for_status()
+    return r.content
+
+
+def best_time(function: Callable[[], object], repeat: int = 5) -> float:
+    """
+    Returns the shortest time taken by a call of function (seconds)
+
+    function - function to time
+    repeat - number of times to call function
+    """
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
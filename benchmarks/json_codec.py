@@ -0,0 +1,60 @@
+"""
+Compares parsing and serializing json with the json module and puppy's json codec
+The codec uses orjson if it is installed
+
+python -m benchmarks.json_codec [--directory tests/fixtures/ddragon]
+"""
+
+import argparse
+import json
+
+from benchmarks.common import add_directory_argument, best_time, read_ddragon_file
+
+FILENAMES = ("champion.json", "item.json", "runesReforged.json", "summoner.json")
+# entries of the synthetic payload, shaped like a list of lcu or stats records
+SYNTHETIC_ENTRIES = 5000
+
+
+def make_synthetic_payload() -> bytes:
+    """
+    Returns a json payload of SYNTHETIC_ENTRIES small records
+    """
+
+    entries = [
+        {"x": i, "y": "s" * 20, "z": [1, 2, 3]} for i in range(SYNTHETIC_ENTRIES)
+    ]
+    return json.dumps({"a": entries}).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_directory_argument(parser)
+    args = parser.parse_args()
+
+    from puppy.apis import json_codec
+
+    print(f"Codec uses {'orjson' if json_codec.orjson is not None else 'json'}")
+    payloads = [(f"synthetic ({SYNTHETIC_ENTRIES} entries)", make_synthetic_payload())]
+    payloads += [
+        (filename, read_ddragon_file(filename, args.directory))
+        for filename in FILENAMES
+    ]
+    for name, contents in payloads:
+        data = json.loads(contents)
+        # json.loads of response.text is what parsing responses took before,
+        # response.json() decodes the bytes to text first
+        json_loads_time = best_time(lambda: json.loads(contents.decode("utf-8")), 50)
+        codec_loads_time = best_time(lambda: json_codec.loads(contents), 50)
+        json_dumps_time = best_time(lambda: json.dumps(data).encode("utf-8"), 50)
+        codec_dumps_time = best_time(lambda: json_codec.dumps(data), 50)
+        print(
+            f"{name}, {len(contents)} bytes: "
+            f"parse {json_loads_time * 1000:.3f}ms with json, "
+            f"{codec_loads_time * 1000:.3f}ms with codec, "
+            f"serialize {json_dumps_time * 1000:.3f}ms with json, "
+            f"{codec_dumps_time * 1000:.3f}ms with codec"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Compares the previous and current Runes.sort_runes on every rune page of a patch
+Checks that both order every page the same way
+
+python -m benchmarks.sort_runes [--directory tests/fixtures/ddragon]
+"""
+
+import argparse
+import itertools
+import random
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.common import add_directory_argument, best_time, read_ddragon_file
+
+SHARDS = (5008, 5002, 5003)  # stat shards, which are disregarded when sorting
+
+
+def make_previous_sort_runes(all_rune_trees: Dict[int, List[int]]):
+    """
+    Returns sort_runes as it was before rune positions were precomputed
+
+    all_rune_trees - mapping of rune tree style to runes in tree order
+    """
+
+    @lru_cache()
+    def style_for_rune(rune: int) -> Optional[int]:
+        for tree_style, runes in all_rune_trees.items():
+            if rune in runes:
+                return tree_style
+
+    def sort_runes(
+        runes: Tuple[int, ...], primary_style: int, secondary_style: int
+    ) -> List[int]:
+        primary_runes = [
+            rune for rune in runes if style_for_rune(rune) == primary_style
+        ]
+        secondary_runes = [
+            rune for rune in runes if style_for_rune(rune) == secondary_style
+        ]
+        sorted_primary_runes = sorted(
+            primary_runes, key=lambda i: all_rune_trees[primary_style].index(i)
+        )
+        sorted_secondary_runes = sorted(
+            secondary_runes, key=lambda i: all_rune_trees[secondary_style].index(i)
+        )
+        return sorted_primary_runes + sorted_secondary_runes
+
+    return sort_runes
+
+
+def all_rune_pages(runes) -> List[Tuple[Tuple[int, ...], int, int]]:
+    """
+    Returns every rune page as (shuffled runes with shards, primary, secondary)
+
+    runes - rune trees of Runes.runes
+    """
+
+    shuffle = random.Random(0).shuffle
+    pages = []
+    for primary_style, _, primary_rows in runes:
+        for secondary_style, _, secondary_rows in runes:
+            if secondary_style == primary_style:
+                continue
+            for primary in itertools.product(*primary_rows):
+                for rows in itertools.combinations(secondary_rows[1:], 2):
+                    for secondary in itertools.product(*rows):
+                        page = [rune_id for rune_id, _ in primary + secondary]
+                        page += SHARDS
+                        shuffle(page)
+                        pages.append((tuple(page), primary_style, secondary_style))
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_directory_argument(parser)
+    args = parser.parse_args()
+
+    from puppy.apis.ddragon import Runes
+    from puppy.apis.json_codec import loads
+
+    runes = Runes.project(
+        loads(read_ddragon_file(Runes.RUNES_FILENAME, args.directory))
+    )
+    Runes.runes = runes  # use the data that was read instead of loading it
+    all_rune_trees = Runes.get_all_rune_trees()
+
+    previous_sort_runes = make_previous_sort_runes(all_rune_trees)
+    # without the lru cache, which would hide the cost of sorting
+    current_sort_runes = Runes.sort_runes.__func__.__wrapped__
+
+    pages = all_rune_pages(runes)
+    for page in pages:
+        previous = previous_sort_runes(*page)
+        current = current_sort_runes(Runes, *page)
+        if previous != current:
+            raise AssertionError(f"{page} sorted to {previous} before, {current} now")
+    print(f"{len(pages)} rune pages sorted the same way")
+
+    previous_time = best_time(lambda: [previous_sort_runes(*page) for page in pages])
+    current_time = best_time(
+        lambda: [current_sort_runes(Runes, *page) for page in pages]
+    )
+    print(f"Previous: {previous_time / len(pages) * 1e6:.2f}us per page")
+    print(f"Current: {current_time / len(pages) * 1e6:.2f}us per page")
+    print(f"Speedup: {previous_time / current_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Compares loading static data by parsing ddragon json with loading snapshots
+
+python -m benchmarks.startup [--directory tests/fixtures/ddragon]
+"""
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import add_directory_argument, best_time, read_ddragon_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_directory_argument(parser)
+    args = parser.parse_args()
+
+    from puppy.apis.ddragon import Champions, Item, Map, Runes, Summoner
+    from puppy.apis.ddragon.cache import DdragonCache
+
+    datasets = (
+        (Champions.CHAMPIONS_FILENAME, Champions.project),
+        (Runes.RUNES_FILENAME, Runes.project),
+        (Item.ITEM_FILENAME, Item.project),
+        (Summoner.SUMMONER_FILENAME, Summoner.project),
+        (Map.MAP_FILENAME, Map.project),
+    )
+
+    total_json_time = 0.0
+    total_snapshot_time = 0.0
+    with tempfile.TemporaryDirectory() as directory:
+        cache = DdragonCache(directory)
+        for filename, project in datasets:
+            contents = read_ddragon_file(filename, args.directory)
+            snapshot_path = Path(f"{filename}.snapshot")
+            cache.write_snapshot(snapshot_path, project(json.loads(contents)))
+            snapshot_size = (Path(directory) / snapshot_path).stat().st_size
+
+            # what loading a cached json file took before snapshots
+            json_time = best_time(lambda: project(json.loads(contents)))
+            snapshot_time = best_time(lambda: cache.read_snapshot(snapshot_path))
+            total_json_time += json_time
+            total_snapshot_time += snapshot_time
+            print(
+                f"{filename}: json {len(contents)} bytes in {json_time * 1000:.3f}ms, "
+                f"snapshot {snapshot_size} bytes in {snapshot_time * 1000:.3f}ms"
+            )
+
+    print(
+        f"Total: json {total_json_time * 1000:.3f}ms, "
+        f"snapshots {total_snapshot_time * 1000:.3f}ms "
+        f"({total_json_time / total_snapshot_time:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main()
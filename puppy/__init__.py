@@ -1,12 +1,18 @@
-from time import sleep
+import atexit
+import time
 import traceback
+from typing import List
 
 try:
-    from puppy.apis import Champions
-    from puppy.apis.data import DataSource
+    from puppy.apis import Champions, Patches, lcu_metrics
+    from puppy.apis.client.exceptions import LeagueProcessNotFoundError
+    from puppy.apis.ddragon import prefetch, StaticData, LcuSource
+    from puppy.apis.data import DataSource, DataSourceAbc
+    from puppy.apis.data.debug_session import DebugSession
     from puppy.config import config
-    from puppy.static import ALL_ROLES, SLEEP_TIME, GAMEFLOW_PHASE
+    from puppy.static import ALL_ROLES, GAMEFLOW_PHASE
     from puppy.lcu_interface import LcuInterface
+    from puppy.models import Role
 except Exception:
     traceback.print_exc()
     input("\nPress enter to exit...")
@@ -26,33 +32,60 @@ def main():
         print(f"Backend is U.GG")
     elif config.backend == "mobalytics":
         print(f"Backend is Mobalytics")
+    if config.static_data_source == "ddragon":
+        print(f"Static data from Data Dragon")
+    elif config.static_data_source == "lcu":
+        print(f"Static data from League client")
     print(f"Flash on {'F' if config.flash_on_f else 'D'}", end="\n\n")
 
-    lcu_interface = LcuInterface()
+    Patches.ttl = config.patches_ttl
+
+    if config.debug:
+        # see where time goes in lcu requests
+        atexit.register(lcu_metrics.dump)
+
+    lcu_interface = LcuInterface(config.poll_times)
+    if config.debug:
+        atexit.register(lcu_interface.lcu.transport.print_counters)
+
+    if config.patch_from_client:
+        Patches.use_client(lcu_interface.lcu)
+    if config.static_data_source == "lcu":
+        StaticData.use(LcuSource(lcu_interface.lcu))
+    # static data is loaded only after the patch to load it for is known
+    prefetch(debug=config.debug)
+    # after prefetching, so that item data is loaded concurrently with the rest
+    config.validate_static_data()
 
     while True:
-        # exit if in game
-        if lcu_interface.get_gameflow_phase() == GAMEFLOW_PHASE.IN_PROGRESS:
-            print("In game, exiting...")
-            raise SystemExit
+        try:
+            # exit if in game
+            if lcu_interface.get_gameflow_phase() == GAMEFLOW_PHASE.IN_PROGRESS:
+                print("In game, exiting...")
+                raise SystemExit
 
-        # wait until in champ select
-        print("#" * 40, end="\n\n")
-        print("Waiting for champ select...")
-        lcu_interface.wait_for_champ_select(SLEEP_TIME)
+            # wait until in champ select
+            print("#" * 40, end="\n\n")
+            print("Waiting for champ select...")
+            lcu_interface.wait_for_champ_select()
 
-        # check what queue we are in
-        current_queue = lcu_interface.get_current_queue()
-        print("Current queue is", current_queue.lcu_queue_name)
+            # check what queue we are in
+            current_queue = lcu_interface.get_current_queue()
+            print("Current queue is", current_queue.lcu_queue_name)
 
-        # check assigned role
-        assigned_role = lcu_interface.get_assigned_role()
-        if assigned_role:
-            print("Assigned role is", assigned_role.display_role_name)
+            # check assigned role
+            assigned_role = lcu_interface.get_assigned_role()
+            if assigned_role:
+                print("Assigned role is", assigned_role.display_role_name)
+        except LeagueProcessNotFoundError as e:
+            # start over once the client responds again (e.g. it restarted)
+            lcu_interface.record_poll_error(e)
+            lcu_interface.wait()
+            continue
 
         # wait until champ is locked in
         print("Waiting for champion lock in...", end="\n\n")
-        lcu_interface.wait_for_champion_lock(SLEEP_TIME)
+        lcu_interface.wait_for_champion_lock()
 
         # init vars
         champion_changed = False
@@ -62,130 +95,172 @@ def main():
         data_source = None
         # main loop
         while True:
-            # if we leave champ select, quit
-            if lcu_interface.get_gameflow_phase() != GAMEFLOW_PHASE.CHAMP_SELECT:
-                print("No longer in champ select", end="\n\n")
-                break
+            try:
+                # one request for the whole state of champ select
+                snapshot = lcu_interface.get_champ_select_snapshot()
+
+                # if we leave champ select, quit
+                if snapshot is None:
+                    print("No longer in champ select", end="\n\n")
+                    if config.debug:
+                        lcu_interface.print_summoner_id_stats()
+                        lcu_interface.scheduler.print_stats()
+                    break
+
+                champion_id = str(snapshot.champion_id)
+                champion_name = Champions.name_for_id(champion_id)
+                # check if we have the same champion as last time
+                if prev_champion_name != champion_name:
+                    champion_changed = True
+
+                    # request data
+                    print("-" * 20, end="\n\n")
+                    print("Locked in", champion_name)
+                    lock_in_time = time.perf_counter()
+                    # get champ data
+                    print("Fetching data...")
+                    if config.debug:
+                        # only log the requests for the latest lock in
+                        DebugSession.clear_log()
+                    data_source = DataSource(
+                        champion_id=champion_id,
+                        current_queue=current_queue,
+                        assigned_role=assigned_role,
+                    )
+                    print("Retrieved data")
+                    if config.debug:
+                        elapsed = time.perf_counter() - lock_in_time
+                        print(f"Data retrieved {elapsed:.3f}s after lock in")
+
+                    print("Building rune pages...")
+                    # build rune pages for correct map
+                    rune_pages = []
+                    for i, role in enumerate(data_source.get_roles()):
+                        # make the page for assigned role active
+                        active = role == assigned_role
+                        # most popular role is active if there is no assigned role
+                        if assigned_role is None and i == 0:
+                            active = True
+                        rune_page = data_source.get_runes(role, active=active).build()
+                        rune_pages.append(rune_page)
+                    # update existing pages and only create or delete pages as needed
+                    lcu_interface.sync_rune_pages(rune_pages)
+                    if config.debug:
+                        elapsed = time.perf_counter() - lock_in_time
+                        print(f"Rune pages applied {elapsed:.3f}s after lock in")
+                    print("Done", end="\n\n")
 
-            champion_id = lcu_interface.get_current_champion()
-            champion_name = Champions.name_for_id(champion_id)
-            # check if we have the same champion as last time
-            if prev_champion_name != champion_name:
-                champion_changed = True
-
-                # request data
-                print("-" * 20, end="\n\n")
-                print("Locked in", champion_name)
-                # get champ data
-                print("Fetching data...")
-                data_source = DataSource(
-                    champion_id=champion_id,
-                    current_queue=current_queue,
-                    assigned_role=assigned_role,
-                )
-                print("Retrieved data")
-
-                print("Building rune pages...")
-                # delete old pages
-                rune_pages = lcu_interface.get_rune_pages()
-                editable_rune_pages = [
-                    page for page in rune_pages if page["isEditable"]  # type: ignore
-                ]
-                for rune_page in editable_rune_pages:
-                    for role in ALL_ROLES:
-                        if role.display_role_name in rune_page["name"]:  # type: ignore
-                            lcu_interface.delete_rune_page(str(rune_page["id"]))  # type: ignore
-                            break
-
-                # build rune pages for correct map and post them
-                rune_pages_to_add = []
-                for i, role in enumerate(data_source.get_roles()):
-                    # make the page for assigned role active
-                    active = role == assigned_role
-                    # most popular role is active if there is no assigned role
-                    if assigned_role is None and i == 0:
-                        active = True
-                    new_rune_page = data_source.get_runes(role, active=active).build()
-                    rune_pages_to_add.append(new_rune_page)
-
-                # search through rune pages for the one marked as active
-                assigned_role_rune_page_id = None
-                for rune_page in rune_pages_to_add:
-                    lcu_interface.post_rune_page(rune_page)
-                    # remember id of assigned rune page to set it as active later
-                    if rune_page["isActive"]:
-                        assigned_role_rune_page_id = (
-                            lcu_interface.get_current_rune_page()["id"]
+                    if config.item_sets_for_all_roles:
+                        print("Building item sets...")
+                        item_sets_data = lcu_interface.get_item_sets_data()
+                        new_item_sets = [
+                            build_item_set(data_source, champion_name, role)
+                            for role in data_source.get_roles()
+                        ]
+                        put_role_item_sets(lcu_interface, item_sets_data, new_item_sets)
+                        print("Done", end="\n\n")
+
+                # get role of current rune page
+                current_rune_page = lcu_interface.get_current_rune_page()
+                if current_rune_page["name"] in [
+                    role.display_role_name for role in ALL_ROLES
+                ]:
+                    current_rune_page_role = ALL_ROLES.get_role_by_display_role_name(
+                        current_rune_page["name"]
+                    )
+                # check if champion changed or if we have a different rune page
+                # than last time we checked
+                if champion_changed or current_rune_page_role != prev_rune_page_role:
+                    assert current_rune_page_role is not None
+                    assert data_source is not None
+
+                    print(
+                        "Rune page changed to",
+                        current_rune_page_role.display_role_name,
+                    )
+                    summoners = data_source.get_summoners(current_rune_page_role)
+                    if config.item_sets_for_all_roles:
+                        # item sets for every role were put on lock in
+                        print("Editing summoners...")
+                        lcu_interface.edit_summoners(summoners)
+                    else:
+                        print("Building item set and editing summoners...")
+                        # get item sets while changing summoners
+                        item_sets_data, _ = lcu_interface.run_concurrently(
+                            lcu_interface.get_item_sets_data_async(),
+                            lcu_interface.edit_summoners_async(summoners),
+                        )
+                        new_item_set = build_item_set(
+                            data_source, champion_name, current_rune_page_role
+                        )
+                        put_role_item_sets(
+                            lcu_interface, item_sets_data, [new_item_set]
                         )
-                # set current rune page to assigned role
-                if assigned_role_rune_page_id:
-                    lcu_interface.set_current_rune_page(str(assigned_role_rune_page_id))
-                print("Done", end="\n\n")
-
-            # get role of current rune page
-            current_rune_page = lcu_interface.get_current_rune_page()
-            if current_rune_page["name"] in [
-                role.display_role_name for role in ALL_ROLES
-            ]:
-                current_rune_page_role = ALL_ROLES.get_role_by_display_role_name(
-                    current_rune_page["name"]
-                )
-            # check if champion changed or if we have a different rune page than last time we checked
-            if champion_changed or current_rune_page_role != prev_rune_page_role:
-                assert current_rune_page_role is not None
-                assert data_source is not None
-
-                print("Rune page changed to", current_rune_page_role.display_role_name)
-                print("Building item set...")
-                # change items
-                item_sets_data = lcu_interface.get_item_sets_data()
-                all_item_sets = item_sets_data["itemSets"]
-
-                # delete old item sets
-                new_all_item_sets = []
-                for item_set in all_item_sets:
-                    for role in ALL_ROLES:
-                        if item_set["title"].endswith(role.display_short_role_name):
-                            break
-                    else:  # only keep ones that do not have the name of a role in their title
-                        new_all_item_sets.append(item_set)
-                all_item_sets = new_all_item_sets
-
-                # first abilities order
-                first_abilities_string = "".join(
-                    data_source.get_first_abilities(
-                        current_rune_page_role
-                    ).to_str_list()
-                )
-                # ability max order
-                ability_max_order_string = "".join(
-                    data_source.get_max_order(current_rune_page_role).to_str_list()
-                )
-
-                # build new item set
-                new_item_set = data_source.get_items(
-                    role=current_rune_page_role,
-                    item_set_name=f"{champion_name} {current_rune_page_role.display_short_role_name}",
-                    first_abilities_string=first_abilities_string,
-                    ability_max_order_string=ability_max_order_string,
-                ).build()
-                # put item set
-                all_item_sets.insert(0, new_item_set)
-                item_sets_data["itemSets"] = all_item_sets
-                lcu_interface.put_item_sets_data(item_sets_data)
-
-                # change summoners
-                print("Editing summoners...")
-                lcu_interface.edit_summoners(
-                    data_source.get_summoners(current_rune_page_role)
-                )
-
-                print("Done", end="\n\n")
-
-            # update variables to check if they have changed in the next poll
-            prev_champion_name = champion_name
-            prev_rune_page_role = current_rune_page_role
-            champion_changed = False
-
-            # pause between polls
-            sleep(SLEEP_TIME)
+
+                    print("Done", end="\n\n")
+
+                # update variables to check if they have changed in the next poll
+                prev_champion_name = champion_name
+                prev_rune_page_role = current_rune_page_role
+                champion_changed = False
+            except LeagueProcessNotFoundError as e:
+                # retry the tick once the client responds again (e.g. it restarted)
+                lcu_interface.record_poll_error(e)
+            else:
+                lcu_interface.scheduler.record_success()
+
+            # wait for changes
+            lcu_interface.wait()
+
+
+def build_item_set(
+    data_source: DataSourceAbc, champion_name: str, role: Role
+) -> dict:
+    """
+    Builds the item set for a role
+    Returns the built item set
+
+    data_source - data source for the locked in champion
+    champion_name - name of the locked in champion
+    role - role to build the item set for
+    """
+
+    # first abilities order
+    first_abilities_string = "".join(
+        data_source.get_first_abilities(role).to_str_list()
+    )
+    # ability max order
+    ability_max_order_string = "".join(data_source.get_max_order(role).to_str_list())
+
+    return data_source.get_items(
+        role=role,
+        item_set_name=f"{champion_name} {role.display_short_role_name}",
+        first_abilities_string=first_abilities_string,
+        ability_max_order_string=ability_max_order_string,
+    ).build()
+
+
+def put_role_item_sets(
+    lcu_interface: LcuInterface, item_sets_data: dict, new_item_sets: List[dict]
+):
+    """
+    Replaces the item sets for roles with new item sets in one put
+
+    lcu_interface - interface to the lcu
+    item_sets_data - current item sets data
+    new_item_sets - built item sets to put
+    """
+
+    # delete old item sets
+    all_item_sets = []
+    for item_set in item_sets_data["itemSets"]:
+        for role in ALL_ROLES:
+            if item_set["title"].endswith(role.display_short_role_name):
+                break
+        else:  # only keep ones that do not have the name of a role in their title
+            all_item_sets.append(item_set)
+
+    # put item sets
+    item_sets_data["itemSets"] = new_item_sets + all_item_sets
+    if not lcu_interface.put_item_sets_data(item_sets_data):
+        print("Item sets unchanged")
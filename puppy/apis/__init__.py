@@ -1,2 +1,2 @@
-from .client import Auth, Lcu
+from .client import Auth, Lcu, AsyncLcu, LcuEvents, LcuMetrics, lcu_metrics
 from .ddragon import Patches, Champions, Runes, Map, Item, Summoner
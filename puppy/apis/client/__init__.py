@@ -1,2 +1,6 @@
 from .auth import Auth
 from .lcu import Lcu
+from .async_lcu import AsyncLcu
+from .events import LcuEvents
+from .metrics import LcuMetrics, lcu_metrics
+from .transport import LcuTransport
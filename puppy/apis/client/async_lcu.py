@@ -0,0 +1,95 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Any
+
+from requests.models import Response
+
+from .lcu import Lcu, POOL_SIZE
+
+
+class AsyncLcu:
+    """
+    Asyncio lcu api connector
+    Requests are made on the session of an Lcu in worker threads,
+        so they share its keep-alive connection pool
+    """
+
+    def __init__(self, lcu: Lcu):
+        """
+        lcu - lcu api connector whose session is used to make requests
+        """
+
+        self.lcu = lcu
+        self.executor = ThreadPoolExecutor(
+            max_workers=POOL_SIZE, thread_name_prefix="lcu"
+        )
+
+    async def get(self, endpoint: List[str]) -> Response:
+        """
+        GETs an endpoint
+        Returns requests response object
+
+        endpoint - iterable that is joined to form the endpoint path
+        """
+
+        return await self.run(self.lcu.get, endpoint)
+
+    async def delete(self, endpoint: List[str]) -> Response:
+        """
+        DELETEs to an endpoint
+        Returns requests response object
+
+        endpoint - iterable that is joined to form the endpoint path
+        """
+
+        return await self.run(self.lcu.delete, endpoint)
+
+    async def post(self, endpoint: List[str], data: Any) -> Response:
+        """
+        POSTs to an endpoint
+        Returns requests response object
+
+        endpoint - iterable that is joined to form the endpoint path
+        data - data to POST
+        """
+
+        return await self.run(self.lcu.post, endpoint, data)
+
+    async def put(self, endpoint: List[str], data: Any) -> Response:
+        """
+        PUTS to an endpoint
+        Returns requests response object
+
+        endpoint - iterable that is joined to form the endpoint path
+        data - data to PUT
+        """
+
+        return await self.run(self.lcu.put, endpoint, data)
+
+    async def patch(self, endpoint: List[str], data: Any) -> Response:
+        """
+        PATCHes to an endpoint
+        Returns requests response object
+
+        endpoint - iterable that is joined to form the endpoint path
+        data - data to PATCH
+        """
+
+        return await self.run(self.lcu.patch, endpoint, data)
+
+    async def get_summoner_id(self):
+        """
+        Returns the summoner id for the current summoner
+        """
+
+        return await self.run(self.lcu.get_summoner_id)
+
+    async def run(self, function, *args) -> Any:
+        """
+        Runs a blocking function in a worker thread
+        Returns the result of the function
+        """
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(function, *args))
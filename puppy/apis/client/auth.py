@@ -1,34 +1,167 @@
+import os
 import platform
 from functools import lru_cache
-from typing import Dict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 import psutil
 
 from .exceptions import UnsupportedPlatformError, LeagueProcessNotFoundError
 
 
+PORT_ENVIRONMENT_VARIABLE = "PUPPY_LCU_PORT"  # overrides the discovered lcu port
+KEY_ENVIRONMENT_VARIABLE = "PUPPY_LCU_KEY"  # overrides the discovered lcu auth token
+# default locations of the client's lockfile
+LOCKFILE_PATHS = {
+    "Windows": Path("C:/Riot Games/League of Legends/lockfile"),
+    "Darwin": Path("/Applications/League of Legends.app/Contents/LoL/lockfile"),
+}
+# names of the client process whose command line has the lcu credentials
+PROCESS_NAMES = {"Windows": "LeagueClientUx.exe", "Darwin": "LeagueClientUx"}
+
+
 class Auth:
     """
     Lcu api authorization
+    Credentials are read from the client's lockfile if it can be found,
+        otherwise from the command line of the client process
     """
 
-    def __init__(self):
-        plat = platform.system()
-        if plat == "Windows":
-            process_name = "LeagueClientUx.exe"
-        elif plat == "Darwin":
-            process_name = "LeagueClientUx"
-        else:
+    # install directory of the last client process found,
+    # checked for a lockfile before the default location
+    install_directory: Optional[Path] = None
+    # (pid, port, key) last discovered, reused while that client is running
+    discovered: Optional[Tuple[int, str, str]] = None
+
+    def __init__(self, port: Optional[str] = None, key: Optional[str] = None):
+        """
+        port - port of the lcu api, discovered from the client if not given
+        key - auth token of the lcu api, discovered from the client if not given
+        The port and key can also be given with the PUPPY_LCU_PORT
+            and PUPPY_LCU_KEY environment variables (e.g. to use a fake lcu)
+        """
+
+        port = port or os.environ.get(PORT_ENVIRONMENT_VARIABLE)
+        key = key or os.environ.get(KEY_ENVIRONMENT_VARIABLE)
+        self.injected = bool(port and key)
+        if self.injected:
+            self.port = port
+            self.key = key
+            self.pid: Optional[int] = None
+            return
+
+        self.platform = platform.system()
+        if self.platform not in PROCESS_NAMES:
             raise UnsupportedPlatformError
 
+        credentials = self.discover()
+        if credentials is None:
+            raise LeagueProcessNotFoundError
+        self.pid, self.port, self.key = credentials
+
+    def is_valid(self) -> bool:
+        """
+        Returns whether the client that the credentials belong to is still running
+        Cheap enough to call whenever a request fails
+        """
+
+        return self.injected or (self.pid is not None and psutil.pid_exists(self.pid))
+
+    def refresh(self) -> bool:
+        """
+        Discovers credentials again if the client is no longer running
+            (e.g. it was restarted)
+        Returns whether the credentials changed
+        """
+
+        if self.is_valid():
+            return False
+
+        credentials = self.discover()
+        if credentials is None or credentials == (self.pid, self.port, self.key):
+            return False
+        self.pid, self.port, self.key = credentials
+        return True
+
+    def discover(self) -> Optional[Tuple[int, str, str]]:
+        """
+        Finds the credentials of the running client
+        Reuses the last discovered credentials if their client is still running,
+            otherwise reads the lockfile and falls back to scanning processes
+        Returns a tuple of the pid, port, and key of the client
+        Returns None if the client is not running
+        """
+
+        discovered = Auth.discovered
+        if discovered is not None and psutil.pid_exists(discovered[0]):
+            return discovered
+
+        Auth.discovered = self.read_lockfiles() or self.scan_processes()
+        return Auth.discovered
+
+    def read_lockfiles(self) -> Optional[Tuple[int, str, str]]:
+        """
+        Reads credentials from the first lockfile of a running client
+        Returns a tuple of the pid, port, and key of the client
+        Returns None if no lockfile of a running client is found
+        """
+
+        for path in self.get_lockfile_paths():
+            credentials = self.read_lockfile(path)
+            if credentials is not None and psutil.pid_exists(credentials[0]):
+                return credentials
+        return None
+
+    def get_lockfile_paths(self) -> List[Path]:
+        """
+        Returns the paths where the lockfile may be, in the order to check them
+        """
+
+        paths = []
+        if Auth.install_directory is not None:
+            paths.append(Auth.install_directory / "lockfile")
+        paths.append(LOCKFILE_PATHS[self.platform])
+        return paths
+
+    @staticmethod
+    def read_lockfile(path: Path) -> Optional[Tuple[int, str, str]]:
+        """
+        Parses a lockfile
+            (formatted as "<process name>:<pid>:<port>:<key>:<protocol>")
+        Returns a tuple of the pid, port, and key of the client
+        Returns None if the lockfile does not exist or is invalid
+
+        path - path of the lockfile
+        """
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                _, pid, port, key, _ = f.read().strip().split(":")
+            return int(pid), port, key
+        except (OSError, ValueError):
+            return None
+
+    def scan_processes(self) -> Optional[Tuple[int, str, str]]:
+        """
+        Reads credentials from the command line of the client process
+        Remembers the install directory of the client so that its lockfile
+            is found next time
+        Returns a tuple of the pid, port, and key of the client
+        Returns None if the client process is not found
+        """
+
+        process_name = PROCESS_NAMES[self.platform]
         for process in psutil.process_iter(attrs=["name"]):
             if process.info["name"] == process_name:
-                args = self.parse_commandline_args(tuple(process.cmdline()))
-                self.port = args["app-port"]
-                self.key = args["remoting-auth-token"]
-                break
-        else:
-            raise LeagueProcessNotFoundError
+                try:
+                    args = self.parse_commandline_args(tuple(process.cmdline()))
+                except psutil.Error:
+                    # exited or inaccessible
+                    continue
+                if "install-directory" in args:
+                    Auth.install_directory = Path(args["install-directory"])
+                return process.pid, args["app-port"], args["remoting-auth-token"]
+        return None
 
     @staticmethod
     @lru_cache()
@@ -0,0 +1,217 @@
+import base64
+import json
+import ssl
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import websocket
+
+from puppy.apis.json_codec import loads
+
+from .lcu import Lcu
+
+
+WAMP_SUBSCRIBE = 5  # wamp message type for subscribing to an event
+WAMP_EVENT = 8  # wamp message type for a published event
+RECONNECT_TIME = 5  # time to wait before reconnecting after the connection is lost
+
+
+class LcuEvents:
+    """
+    Lcu api event subscription over WebSocket (WAMP)
+    Keeps the latest data pushed by the client for each subscribed endpoint
+    """
+
+    def __init__(self, lcu: Lcu, uris: List[str]):
+        """
+        lcu - lcu api connector whose credentials are used to connect
+        uris - endpoint paths to subscribe to (e.g. "/lol-gameflow/v1/gameflow-phase")
+        """
+
+        self.lcu = lcu
+        self.uris = list(uris)
+        self.ws: Optional[websocket.WebSocketApp] = None
+        self.data: Dict[str, Any] = {}
+        self.listeners: Dict[str, List[Callable[[Any], None]]] = {}
+        self.connection_listeners: List[Callable[[bool], None]] = []
+        self.version = 0  # incremented every time an event is received
+        self.connected = False
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        """
+        Starts listening for events in a background thread
+        """
+
+        self.thread.start()
+
+    def run(self):
+        """
+        Connects and listens for events, reconnecting when the connection is lost
+        """
+
+        while True:
+            # the client may have restarted since the connection was lost
+            try:
+                self.lcu.refresh_auth()
+            except Exception:
+                pass
+            auth = self.lcu.auth
+            token = base64.b64encode(f"riot:{auth.key}".encode()).decode()
+            self.ws = ws = websocket.WebSocketApp(
+                f"wss://127.0.0.1:{auth.port}/",
+                header=[f"Authorization: Basic {token}"],
+                on_open=self.on_open,
+                on_message=self.on_message,
+                on_close=self.on_close,
+            )
+            # calls on_close however the connection ends
+            ws.run_forever(sslopt={"cert_reqs": ssl.CERT_NONE})
+            time.sleep(RECONNECT_TIME)
+
+    def on_open(self, ws: websocket.WebSocketApp):
+        with self.condition:
+            for uri in self.uris:
+                ws.send(json.dumps([WAMP_SUBSCRIBE, self.event_name(uri)]))
+            self.connected = True
+            self.condition.notify_all()
+        for listener in self.connection_listeners:
+            listener(True)
+
+    def on_message(self, ws: websocket.WebSocketApp, message: str):
+        try:
+            message_type, _, payload = loads(message)
+        except ValueError:
+            return
+        if message_type != WAMP_EVENT:
+            return
+
+        uri = payload["uri"]
+        data = None if payload["eventType"] == "Delete" else payload["data"]
+        with self.condition:
+            self.data[uri] = data
+            self.version += 1
+            self.condition.notify_all()
+        for listener in self.listeners.get(uri, []):
+            listener(data)
+
+    def on_close(self, ws: websocket.WebSocketApp, status: Any, message: Any):
+        with self.condition:
+            # also called when connecting fails, which is not a disconnection
+            was_connected = self.connected
+            # data may change without us knowing while disconnected
+            self.connected = False
+            self.data.clear()
+            self.condition.notify_all()
+        if not was_connected:
+            return
+        for listener in self.connection_listeners:
+            listener(False)
+
+    def get(self, uri: str) -> Tuple[bool, Any]:
+        """
+        Returns a tuple of whether there is up to date data for an endpoint,
+            and the data
+        Data is None if the endpoint does not exist
+
+        uri - endpoint path
+        """
+
+        with self.condition:
+            if self.connected and uri in self.data:
+                return True, self.data[uri]
+            return False, None
+
+    def seed(self, uri: str, data: Any, version: int):
+        """
+        Stores data fetched for an endpoint outside of events,
+            unless an event was received since the data was fetched
+
+        uri - endpoint path
+        data - data fetched for the endpoint
+        version - version before the data was fetched
+        """
+
+        with self.condition:
+            if self.connected and self.version == version and uri in self.uris:
+                self.data.setdefault(uri, data)
+
+    def invalidate(self, uri: str):
+        """
+        Forgets the data of an endpoint so that it is fetched again
+            (e.g. after changing it, before its event is received)
+        Data fetched before it was forgotten is not stored by seed
+
+        uri - endpoint path
+        """
+
+        with self.condition:
+            self.data.pop(uri, None)
+            self.version += 1
+
+    def subscribe(self, uri: str):
+        """
+        Subscribes to an endpoint that was not known when events were created
+        Does nothing if the endpoint is already subscribed to
+
+        uri - endpoint path
+        """
+
+        with self.condition:
+            if uri in self.uris:
+                return
+            self.uris.append(uri)
+            if self.connected and self.ws is not None:
+                try:
+                    self.ws.send(json.dumps([WAMP_SUBSCRIBE, self.event_name(uri)]))
+                except websocket.WebSocketException:
+                    # subscribed to again on reconnect
+                    pass
+
+    def add_listener(self, uri: str, listener: Callable[[Any], None]):
+        """
+        Calls listener with the new data every time an event is received for an endpoint
+
+        uri - endpoint path
+        listener - function taking the data of the event
+        """
+
+        self.listeners.setdefault(uri, []).append(listener)
+
+    def add_connection_listener(self, listener: Callable[[bool], None]):
+        """
+        Calls listener every time the connection is opened, or closed after
+            being opened
+
+        listener - function taking whether the connection is open
+        """
+
+        self.connection_listeners.append(listener)
+
+    def wait(self, version: int, timeout: float) -> int:
+        """
+        Blocks until an event newer than version is received, the connection state
+            changes, or timeout seconds pass
+        Returns the current version
+
+        version - version that has already been seen
+        timeout - maximum time to block (seconds)
+        """
+
+        with self.condition:
+            connected = self.connected
+            self.condition.wait_for(
+                lambda: self.version != version or self.connected != connected,
+                timeout,
+            )
+            return self.version
+
+    @staticmethod
+    def event_name(uri: str) -> str:
+        """
+        Returns the name of the event published for an endpoint
+        """
+
+        return "OnJsonApiEvent" + uri.replace("/", "_")
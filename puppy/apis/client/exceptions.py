@@ -16,3 +16,13 @@ class UnsupportedPlatformError(Exception):
             super().__init__(*args, **kwargs)
         else:
             super().__init__(DEFAULT)
+
+
+class LcuUnavailableError(LeagueProcessNotFoundError):
+    def __init__(self, *args, **kwargs):
+        DEFAULT = "League client did not respond"
+
+        if args or kwargs:
+            super().__init__(*args, **kwargs)
+        else:
+            super().__init__(DEFAULT)
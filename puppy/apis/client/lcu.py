@@ -1,12 +1,20 @@
-from typing import List, Any
+import threading
+from typing import List, Any, Optional
 
 import urllib3
 import requests
+from requests.adapters import HTTPAdapter
 from requests.models import Response
-from requests.exceptions import ConnectionError
+
+from puppy.apis.json_codec import dumps, response_json
 
 from .auth import Auth
-from .exceptions import LeagueProcessNotFoundError
+from .metrics import LcuMetrics, lcu_metrics
+from .transport import LcuTransport
+
+
+POOL_SIZE = 8  # maximum number of concurrent keep-alive connections to the lcu
+JSON_HEADERS = {"Content-Type": "application/json"}  # headers of requests with json
 
 
 class Lcu:
@@ -14,18 +22,43 @@ class Lcu:
     Lcu api connector
     """
 
-    def __init__(self):
+    def __init__(
+        self, auth: Optional[Auth] = None, metrics: LcuMetrics = lcu_metrics
+    ):
+        """
+        auth - lcu api authorization, discovered from the client if not given
+        metrics - registry to record request metrics in
+        """
 
         # don't verify ssl
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-        auth = Auth()
+        self.auth = auth or Auth()
+        self.auth_lock = threading.Lock()
 
         self.session = requests.Session()
         self.session.headers.update({"Accept": "application/json"})
-        self.session.auth = ("riot", auth.key) # type: ignore
         self.session.verify = False
-        self.BASE_URL = f"https://127.0.0.1:{auth.port}/"
+        # environment ca bundles and proxies would override verify and localhost
+        self.session.trust_env = False
+        # allow concurrent requests without opening a new connection for each
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.use_auth()
+        self.metrics = metrics
+        self.transport = LcuTransport(self)
+
+        # summoner id is cached until the connection or account changes
+        self.summoner_id: Optional[int] = None
+        # incremented whenever the summoner id is set, so that a request made
+        # before it was invalidated does not store a stale id
+        self.summoner_id_generation = 0
+        self.summoner_id_lock = threading.Lock()
+        self.summoner_id_requests = 0  # times the summoner id was requested
+        self.summoner_id_cache_hits = 0  # times it was returned from the cache
+
+        self.request_count = 0  # number of requests made
+        self.request_count_lock = threading.Lock()
 
     def get(self, endpoint: List[str]) -> Response:
         """
@@ -35,8 +68,8 @@ class Lcu:
         endpoint - iterable that is joined to form the endpoint path
         """
 
-        url = self.make_url(endpoint)
-        return self.request("get", url)
+        path = self.make_path(endpoint)
+        return self.request("get", path)
 
     def delete(self, endpoint: List[str]) -> Response:
         """
@@ -46,8 +79,8 @@ class Lcu:
         endpoint - iterable that is joined to form the endpoint path
         """
 
-        url = self.make_url(endpoint)
-        return self.request("delete", url)
+        path = self.make_path(endpoint)
+        return self.request("delete", path)
 
     def post(self, endpoint: List[str], data: Any) -> Response:
         """
@@ -58,8 +91,8 @@ class Lcu:
         data - data to POST
         """
 
-        url = self.make_url(endpoint)
-        return self.request("post", url, json=data)
+        path = self.make_path(endpoint)
+        return self.request("post", path, data=dumps(data), headers=JSON_HEADERS)
 
     def put(self, endpoint: List[str], data: Any) -> Response:
         """
@@ -70,8 +103,8 @@ class Lcu:
         data - data to PUT
         """
 
-        url = self.make_url(endpoint)
-        return self.request("put", url, json=data)
+        path = self.make_path(endpoint)
+        return self.request("put", path, data=dumps(data), headers=JSON_HEADERS)
 
     def patch(self, endpoint: List[str], data: Any) -> Response:
         """
@@ -82,34 +115,95 @@ class Lcu:
         data - data to PATCH
         """
 
-        url = self.make_url(endpoint)
-        return self.request("patch", url, json=data)
+        path = self.make_path(endpoint)
+        return self.request("patch", path, data=dumps(data), headers=JSON_HEADERS)
 
-    def make_url(self, endpoint: List[str]) -> str:
+    def make_path(self, endpoint: List[str]) -> str:
         """
-        Constructs a url from an endpoint iterable
-        Returns url string
+        Constructs a url path from an endpoint iterable
+        Returns path string (e.g. "/lol-perks/v1/pages")
 
         endpoint - iterable that is joined to form the endpoint path
         """
 
-        return self.BASE_URL + "/".join(endpoint)
+        return "/" + "/".join(endpoint)
 
-    def request(self, *args, **kwargs) -> Response:
+    def request(self, method: str, path: str, **kwargs) -> Response:
         """
-        Performs an http request
-
+        Performs an http request through the transport
+        The url is built by the transport so that it always uses the current
+            credentials, even if they change while the request is made
         Returns requests response object
+
+        method - http method
+        path - path of the url to request (e.g. "/lol-perks/v1/pages")
+        """
+
+        with self.request_count_lock:
+            self.request_count += 1
+        return self.transport.request(method, path, **kwargs)
+
+    def use_auth(self):
+        """
+        Makes requests with the current credentials
+        """
+
+        self.session.auth = ("riot", self.auth.key)  # type: ignore
+        self.BASE_URL = f"https://127.0.0.1:{self.auth.port}/"
+
+    def refresh_auth(self) -> bool:
+        """
+        Reauthenticates if the client is no longer running
+        Returns whether the credentials changed
         """
 
-        try:
-            return self.session.request(*args, **kwargs)
-        except ConnectionError:
-            raise LeagueProcessNotFoundError
+        with self.auth_lock:
+            if not self.auth.refresh():
+                return False
+            self.use_auth()
+        # a restarted client may be logged in to a different account
+        self.set_summoner_id(None)
+        return True
 
-    def get_summoner_id(self):
+    def get_summoner_id(self) -> int:
         """
         Returns the summoner id for the current summoner
+        Only requested from the lcu the first time after it is invalidated
+        The request is made without holding the lock, since reauthenticating
+            during it invalidates the summoner id
+        """
+
+        with self.summoner_id_lock:
+            if self.summoner_id is not None:
+                self.summoner_id_cache_hits += 1
+                return self.summoner_id
+            self.summoner_id_requests += 1
+            generation = self.summoner_id_generation
+        r = self.get(["lol-summoner", "v1", "current-summoner"])
+        summoner_id = response_json(r)["summonerId"]
+        with self.summoner_id_lock:
+            # not cached if it was invalidated or set while it was requested
+            if self.summoner_id_generation == generation:
+                self.summoner_id = summoner_id
+        return summoner_id
+
+    def set_summoner_id(self, summoner_id: Optional[int]):
+        """
+        Sets the cached summoner id
+        None invalidates it so that it is requested again on next use
+
+        summoner_id - id of the current summoner
+        """
+
+        with self.summoner_id_lock:
+            self.summoner_id = summoner_id
+            self.summoner_id_generation += 1
+
+    def reset_summoner_id_counters(self):
+        """
+        Resets the counts of summoner id requests and cache hits
         """
 
-        return self.get(["lol-summoner", "v1", "current-summoner"]).json()["summonerId"]
+        with self.summoner_id_lock:
+            self.summoner_id_requests = 0
+            self.summoner_id_cache_hits = 0
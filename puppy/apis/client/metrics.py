@@ -0,0 +1,154 @@
+import json
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+
+METRICS_FILENAME = "lcu_metrics.json"  # name of file to dump lcu request metrics to
+MAX_SAMPLES = 10000  # maximum number of durations kept per endpoint
+PERCENTILES = (50, 95, 99)  # percentiles of durations to report
+
+
+class EndpointMetrics:
+    """
+    Metrics of the requests made to one endpoint template
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0  # requests that raised or had a server error status
+        self.bytes = 0  # bytes of response bodies
+        self.durations: Deque[float] = deque(maxlen=MAX_SAMPLES)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Returns a dict of the metrics with duration percentiles in milliseconds
+        """
+
+        durations = sorted(self.durations)
+        summary: Dict[str, Any] = {
+            "count": self.count,
+            "errors": self.errors,
+            "bytes": self.bytes,
+        }
+        for percentile in PERCENTILES:
+            summary[f"p{percentile}_ms"] = (
+                round(self.percentile(durations, percentile) * 1000, 3)
+                if durations
+                else None
+            )
+        return summary
+
+    @staticmethod
+    def percentile(durations: list, percentile: float) -> float:
+        """
+        Returns the nearest rank percentile of sorted durations
+
+        durations - sorted durations
+        percentile - percentile between 0 and 100
+        """
+
+        rank = max(round(percentile / 100 * len(durations)), 1)
+        return durations[rank - 1]
+
+
+class LcuMetrics:
+    """
+    In process registry of lcu request metrics per endpoint template
+    Endpoint templates replace ids in paths with {id}
+        (e.g. "DELETE /lol-perks/v1/pages/{id}")
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.endpoints: Dict[str, EndpointMetrics] = {}
+
+    def record(
+        self,
+        method: str,
+        path: str,
+        duration: float,
+        error: bool,
+        size: int = 0,
+    ):
+        """
+        Records a request
+
+        method - http method
+        path - path of the request url
+        duration - time taken by the request (seconds)
+        error - whether the request failed
+        size - bytes of the response body
+        """
+
+        template = f"{method.upper()} {self.template(path)}"
+        with self.lock:
+            endpoint = self.endpoints.get(template)
+            if endpoint is None:
+                endpoint = self.endpoints[template] = EndpointMetrics()
+            endpoint.count += 1
+            endpoint.errors += error
+            endpoint.bytes += size
+            endpoint.durations.append(duration)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns a dict of endpoint templates to their metrics
+        """
+
+        with self.lock:
+            return {
+                template: endpoint.summary()
+                for template, endpoint in sorted(self.endpoints.items())
+            }
+
+    def to_json(self) -> str:
+        """
+        Returns the metrics of every endpoint as json
+        """
+
+        return json.dumps(self.summary(), indent=4)
+
+    def dump(self, filename: Optional[str] = METRICS_FILENAME):
+        """
+        Prints the metrics of every endpoint and writes them to a json file
+
+        filename - name of file to write json to, None to only print
+        """
+
+        summary = self.summary()
+        print("LCU requests:")
+        for template, metrics in summary.items():
+            print(
+                f"    {template}: {metrics['count']} requests, "
+                f"{metrics['errors']} errors, {metrics['bytes']} bytes, "
+                f"p50 {metrics['p50_ms']}ms, p95 {metrics['p95_ms']}ms, "
+                f"p99 {metrics['p99_ms']}ms"
+            )
+        if filename is not None:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=4)
+
+    def reset(self):
+        """
+        Removes all recorded metrics
+        """
+
+        with self.lock:
+            self.endpoints.clear()
+
+    @staticmethod
+    def template(path: str) -> str:
+        """
+        Returns the endpoint template of a path
+
+        path - path of a request url
+        """
+
+        path = path.split("?", 1)[0]
+        return "/".join(
+            "{id}" if segment.isdigit() else segment for segment in path.split("/")
+        )
+
+
+lcu_metrics = LcuMetrics()
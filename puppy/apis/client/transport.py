@@ -0,0 +1,204 @@
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from requests.models import Response
+from requests.exceptions import ConnectionError, Timeout
+
+from .exceptions import LcuUnavailableError
+
+if TYPE_CHECKING:
+    from .lcu import Lcu
+
+
+TIMEOUT = (2, 10)  # (connect, read) timeouts of lcu requests (seconds)
+MAX_RETRIES = 3  # maximum number of retries of an idempotent request
+RETRY_BACKOFF = 0.1  # base time to wait before retrying, doubled every retry (seconds)
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+RETRY_STATUSES = {502, 503, 504}  # statuses of idempotent requests that are retried
+FAILURE_THRESHOLD = 5  # consecutive failures that open the circuit breaker
+CIRCUIT_COOLDOWN = 5  # time the circuit breaker stays open (seconds)
+
+
+class LcuTransport:
+    """
+    Sends requests for an Lcu with timeouts, bounded jittered retries of
+        idempotent requests, reauthentication when the client restarts,
+        and a circuit breaker that fails fast while the client is unreachable
+    """
+
+    def __init__(
+        self,
+        lcu: "Lcu",
+        timeout: Tuple[float, float] = TIMEOUT,
+        max_retries: int = MAX_RETRIES,
+    ):
+        """
+        lcu - lcu api connector whose session and credentials are used
+        timeout - (connect, read) timeouts of requests (seconds)
+        max_retries - maximum number of retries of an idempotent request
+        """
+
+        self.lcu = lcu
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+        self.lock = threading.Lock()
+        self.consecutive_failures = 0
+        self.opened_at = None  # time the circuit breaker opened, None if closed
+        self.counters = {
+            "requests": 0,  # attempts sent, including retries
+            "retries": 0,
+            "timeouts": 0,
+            "connection_errors": 0,
+            "reconnects": 0,  # times new credentials were used after a restart
+            "circuit_opens": 0,
+            "rejected": 0,  # requests failed fast by the open circuit breaker
+        }
+
+    def request(self, method: str, path: str, **kwargs) -> Response:
+        """
+        Performs an http request, retrying it if it is safe to
+        Returns requests response object
+        Raises LcuUnavailableError if the client cannot be reached,
+            does not respond in time, or the circuit breaker is open
+
+        method - http method
+        path - path of the url to request (e.g. "/lol-perks/v1/pages")
+        """
+
+        kwargs.setdefault("timeout", self.timeout)
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            self.check_circuit()
+            self.count("requests")
+            start = time.perf_counter()
+            try:
+                r = self.lcu.session.request(
+                    method, self.lcu.BASE_URL + path[1:], **kwargs
+                )
+            except (ConnectionError, Timeout) as e:
+                self.lcu.metrics.record(method, path, time.perf_counter() - start, True)
+                self.record_failure()
+                if isinstance(e, Timeout):
+                    self.count("timeouts")
+                if isinstance(e, ConnectionError):
+                    self.count("connection_errors")
+                    # the client may have restarted with new credentials,
+                    # in which case the request never reached it
+                    if self.lcu.refresh_auth():
+                        self.count("reconnects")
+                        attempt += 1
+                        if attempt <= self.max_retries:
+                            continue
+                if not idempotent or attempt >= self.max_retries:
+                    if isinstance(e, ConnectionError):
+                        raise LcuUnavailableError(
+                            "Could not connect to League client for "
+                            f"{method.upper()} {path}"
+                        ) from e
+                    raise LcuUnavailableError(
+                        f"League client did not respond to {method.upper()} {path}"
+                    ) from e
+            else:
+                self.lcu.metrics.record(
+                    method,
+                    path,
+                    time.perf_counter() - start,
+                    r.status_code >= 500,
+                    len(r.content),
+                )
+                if (
+                    not idempotent
+                    or r.status_code not in RETRY_STATUSES
+                    or attempt >= self.max_retries
+                ):
+                    self.record_success()
+                    return r
+
+            self.count("retries")
+            time.sleep(self.get_backoff(attempt))
+            attempt += 1
+
+    def check_circuit(self):
+        """
+        Raises LcuUnavailableError if the circuit breaker is open
+        Lets a trial request through once the cooldown has passed
+        """
+
+        with self.lock:
+            if self.opened_at is None:
+                return
+            remaining = self.opened_at + CIRCUIT_COOLDOWN - time.monotonic()
+            if remaining <= 0:
+                # half open, the next failure opens the circuit again
+                self.opened_at = None
+                self.consecutive_failures = FAILURE_THRESHOLD - 1
+                return
+            self.counters["rejected"] += 1
+        raise LcuUnavailableError(
+            f"League client unreachable, retrying in {remaining:.1f}s"
+        )
+
+    def record_failure(self):
+        """
+        Records a failed attempt, opening the circuit breaker after too many
+        """
+
+        with self.lock:
+            self.consecutive_failures += 1
+            failing = self.consecutive_failures >= FAILURE_THRESHOLD
+            if failing and self.opened_at is None:
+                self.opened_at = time.monotonic()
+                self.counters["circuit_opens"] += 1
+
+    def record_success(self):
+        """
+        Records a successful request, closing the circuit breaker
+        """
+
+        with self.lock:
+            self.consecutive_failures = 0
+            self.opened_at = None
+
+    def count(self, counter: str):
+        """
+        Increments a counter
+
+        counter - name of counter
+        """
+
+        with self.lock:
+            self.counters[counter] += 1
+
+    def get_counters(self) -> Dict[str, int]:
+        """
+        Returns a copy of the retry, timeout, and circuit breaker counters
+        """
+
+        with self.lock:
+            return dict(self.counters)
+
+    def print_counters(self):
+        """
+        Prints the retry, timeout, and circuit breaker counters
+        """
+
+        counters = self.get_counters()
+        print(
+            "LCU transport: "
+            + ", ".join(f"{count} {name}" for name, count in counters.items())
+        )
+
+    @staticmethod
+    def get_backoff(attempt: int) -> float:
+        """
+        Returns the time to wait before a retry, with full jitter (seconds)
+
+        attempt - number of the attempt that failed, starting at 0
+        """
+
+        return random.uniform(0, RETRY_BACKOFF * 2 ** attempt)
@@ -1,3 +1,4 @@
+import threading
 import traceback
 
 import requests
@@ -9,6 +10,19 @@ DEBUG_FILENAME = "puppy.log"
 
 
 class DebugSession:
+    # requests may be made concurrently, each one is logged in a single write
+    lock = threading.Lock()
+
+    @classmethod
+    def clear_log(cls):
+        """
+        Empties the log so that it only keeps the requests made since
+            (e.g. for the latest lock in)
+        """
+
+        with cls.lock:
+            open(DEBUG_FILENAME, "w", encoding="utf-8").close()
+
     def __init__(self, session: Session):
         self.session = session
 
@@ -19,31 +33,34 @@ class DebugSession:
         return self._request("POST", *args, **kwargs)
 
     def _request(self, method, *args, **kwargs) -> Response:
-        if config.debug:
-            with open(DEBUG_FILENAME, "w", encoding="utf-8") as f:
-                f.write("\n".join([method, str(args), str(kwargs), "\n"]))
+        request = "\n".join([method, str(args), str(kwargs), "\n"])
 
         try:
             r = self.session.request(method, *args, **kwargs)
         except Exception as e:
             if config.debug:
-                with open(DEBUG_FILENAME, "a", encoding="utf-8") as f:
-                    traceback.print_exc(file=f)
+                self._log(request + traceback.format_exc())
             raise
 
         if config.debug:
-            with open(DEBUG_FILENAME, "a", encoding="utf-8") as f:
-                f.write(
-                    "\n".join(
-                        [
-                            "status",
-                            str(r.status_code),
-                            "headers",
-                            str(r.headers),
-                            "body",
-                            r.text,
-                        ]
-                    )
+            self._log(
+                request
+                + "\n".join(
+                    [
+                        "status",
+                        str(r.status_code),
+                        "headers",
+                        str(r.headers),
+                        "body",
+                        r.text,
+                        "\n",
+                    ]
                 )
+            )
 
         return r
+
+    def _log(self, text: str):
+        with self.lock:
+            with open(DEBUG_FILENAME, "a", encoding="utf-8") as f:
+                f.write(text)
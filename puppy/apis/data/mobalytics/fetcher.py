@@ -8,6 +8,7 @@ from puppy.static import ALL_ROLES, UAS, QUEUES, SUMMONERS_RIFT, ARAM_QUEUES
 from puppy.models import RoleList, Role, Queue
 from puppy.apis.data.debug_session import DebugSession
 from puppy.apis.data.exceptions import NoDataError
+from puppy.apis.json_codec import response_json
 from puppy.apis.ddragon import Patches, Champions
 from .query import QUERY
 
@@ -241,7 +242,7 @@ class Fetcher:
                 },
             },
         )
-        data = r.json()
+        data = response_json(r)
         if "errors" in data:
             # https://www.apollographql.com/docs/apollo-server/v3/performance/apq/
             r = self.session.post(
@@ -258,7 +259,7 @@ class Fetcher:
                     },
                 },
             )
-            data = r.json()
+            data = response_json(r)
             if "errors" in data:
                 raise NoDataError(
                     f"Query failed for "
@@ -3,11 +3,11 @@
 # (because Mobalytics only supports those two)
 
 from functools import lru_cache
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
 
 from puppy.apis.data.data_source import DataSourceAbc
-from puppy.apis.data.exceptions import NoDataError
 from puppy.apis.data.mobalytics.fetcher import Fetcher
+from puppy.apis.data.patch_data import fetch_patch_data
 from puppy.apis.ddragon import Patches, Runes, Item
 from puppy.config import config
 from puppy.models import (
@@ -20,7 +20,6 @@ from puppy.models import (
     AbilityList,
 )
 from puppy.static import (
-    MIN_ACCEPTABLE_PATCH_MATCH_RATIO,
     FLASH,
     ABILITY_NUMBERS,
     SUMMONERS_RIFT,
@@ -35,60 +34,26 @@ class Mobalytics(DataSourceAbc):
         self.current_queue = current_queue
         self.assigned_role = assigned_role
 
-        try:
-            current_patch_data = Fetcher(
-                champion_id,
-                current_queue,
-                Patches.get_current_patch(),
-            )
-        except NoDataError:
-            print("No data on current patch, attempting to revert to previous patch")
-            self.fetcher = Fetcher(
-                champion_id,
-                current_queue,
-                Patches.get_previous_patch(),
-            )
-            return
-
-        if config.revert_patch:
-            try:
-                previous_patch_data = Fetcher(
-                    champion_id,
-                    current_queue,
-                    Patches.get_previous_patch(),
-                )
-            except NoDataError:
-                print("No data from previous patch")
-                self.fetcher = current_patch_data
-                return
-
-            current_patch_matches = 0
-            previous_patch_matches = 0
-            for role in set(previous_patch_data.current_queue_available_roles()) & set(
-                current_patch_data.current_queue_available_roles()
-            ):
-                build = current_patch_data.get_build("world", role)
-                current_patch_matches += build["stats"]["matches"]
-                build = previous_patch_data.get_build("world", role)
-                previous_patch_matches += build["stats"]["matches"]
-
-            # use current patch only if max match count of any role in current patch is at least n% of
-            # the max match count in any role on the previous patch
-            if (
-                current_patch_matches / previous_patch_matches
-                > MIN_ACCEPTABLE_PATCH_MATCH_RATIO
-            ):
-                print(
-                    f"Using current patch's data ({current_patch_matches}/{previous_patch_matches} = {current_patch_matches / previous_patch_matches:.2f})"
-                )
-                self.fetcher = current_patch_data
-            else:
-                print(
-                    f"Reverting to previous patch data ({current_patch_matches}/{previous_patch_matches} = {current_patch_matches / previous_patch_matches:.2f})"
-                )
-                self.fetcher = previous_patch_data
-        else:
-            self.fetcher = current_patch_data
+        self.fetcher = fetch_patch_data(
+            lambda patch: Fetcher(champion_id, current_queue, patch),
+            self.count_matches,
+            Patches.get_current_major_minor(),
+            Patches.get_previous_major_minor(),
+            config.revert_patch,
+        )
+
+    @staticmethod
+    def count_matches(fetcher: Fetcher, roles: Iterable[Role]) -> int:
+        """
+        Returns the number of matches played in roles
+
+        fetcher - fetcher of a patch's data
+        roles - roles to count matches of
+        """
+
+        return sum(
+            fetcher.get_build("world", role)["stats"]["matches"] for role in roles
+        )
 
     @lru_cache()
     def get_roles(self) -> RoleList:
@@ -0,0 +1,84 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+from puppy.apis.data.exceptions import NoDataError
+from puppy.models import Role
+from puppy.static import MIN_ACCEPTABLE_PATCH_MATCH_RATIO, ENOUGH_PATCH_MATCHES
+
+
+def fetch_patch_data(
+    make_fetcher: Callable[[str], Any],
+    count_matches: Callable[[Any, Iterable[Role]], int],
+    current_patch: str,
+    previous_patch: str,
+    revert_patch: bool,
+) -> Any:
+    """
+    Fetches the data of the current patch, and of the previous patch concurrently
+        if it may be used instead
+    The previous patch is not waited for or compared against if the current patch
+        has enough matches on its own, though its download still finishes
+        in the background
+    Returns the fetcher of the patch whose data should be used
+    Raises NoDataError if neither patch has data
+
+    make_fetcher - makes the fetcher of a patch's data
+    count_matches - returns the number of matches played in roles of a fetcher
+    current_patch - current patch, in the format the fetcher expects
+    previous_patch - previous patch, in the format the fetcher expects
+    revert_patch - whether to use the previous patch's data if the current patch
+        has too few matches
+    """
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    current_future = executor.submit(make_fetcher, current_patch)
+    previous_future = (
+        executor.submit(make_fetcher, previous_patch) if revert_patch else None
+    )
+    # both fetches have started, do not wait for the previous patch if it turns
+    # out not to be needed
+    executor.shutdown(wait=False)
+
+    try:
+        current_patch_data = current_future.result()
+    except NoDataError:
+        print("No data on current patch, attempting to revert to previous patch")
+        if previous_future is None:
+            return make_fetcher(previous_patch)
+        return previous_future.result()
+
+    if previous_future is None:
+        # no reversion, use current patch
+        return current_patch_data
+
+    current_patch_matches = count_matches(
+        current_patch_data, current_patch_data.current_queue_available_roles()
+    )
+    if current_patch_matches >= ENOUGH_PATCH_MATCHES:
+        print(f"Using current patch's data ({current_patch_matches} matches)")
+        return current_patch_data
+
+    try:
+        previous_patch_data = previous_future.result()
+    except NoDataError:
+        print("No data from previous patch")
+        return current_patch_data
+
+    roles = set(previous_patch_data.current_queue_available_roles()) & set(
+        current_patch_data.current_queue_available_roles()
+    )
+    current_patch_matches = count_matches(current_patch_data, roles)
+    previous_patch_matches = count_matches(previous_patch_data, roles)
+
+    # use current patch only if max match count of any role in current patch is at least n% of
+    # the max match count in any role on the previous patch
+    ratio = current_patch_matches / previous_patch_matches
+    if ratio > MIN_ACCEPTABLE_PATCH_MATCH_RATIO:
+        print(
+            f"Using current patch's data ({current_patch_matches}/{previous_patch_matches} = {ratio:.2f})"
+        )
+        return current_patch_data
+    print(
+        f"Reverting to previous patch data ({current_patch_matches}/{previous_patch_matches} = {ratio:.2f})"
+    )
+    return previous_patch_data
@@ -1,6 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import Dict, Any, Optional
-from json import JSONDecodeError
 
 import requests
 
@@ -8,6 +8,7 @@ from puppy.static import SUMMONERS_RIFT, UAS, ALL_ROLES
 from puppy.models import RoleList, Role, Queue
 from puppy.apis.data.debug_session import DebugSession
 from puppy.apis.data.exceptions import NoDataError
+from puppy.apis.json_codec import JSONDecodeError, response_json
 from puppy.apis.ddragon import Champions
 
 
@@ -60,8 +61,8 @@ class Fetcher:
         session.headers.update({"User-Agent": UAS})
         session = DebugSession(session)
 
-        ugg_api_versions = (
-            session.get(self.UGG_API_VERSIONS).json().get(underscored_patch)
+        ugg_api_versions = response_json(session.get(self.UGG_API_VERSIONS)).get(
+            underscored_patch
         )
         if ugg_api_versions is None:
             raise NoDataError(f"No U.GG data for version {underscored_patch}")
@@ -78,45 +79,37 @@ class Fetcher:
             ugg_rankings_api_version
         )
 
+        urls = (
+            self.UGG_PRIMARY_ROLES.format(
+                ugg_primary_roles_api_version_major_minor=ugg_primary_roles_api_version_major_minor,
+                underscored_patch=underscored_patch,
+                ugg_primary_roles_api_version=ugg_primary_roles_api_version,
+            ),
+            self.UGG_OVERVIEW.format(
+                ugg_overview_api_version_major_minor=ugg_overview_api_version_major_minor,
+                underscored_patch=underscored_patch,
+                ugg_queue_name=current_queue.ugg_queue_name,
+                champion_id=champion_id,
+                ugg_overview_api_version=ugg_overview_api_version,
+            ),
+            self.UGG_RANKINGS.format(
+                ugg_rankings_api_version_major_minor=ugg_rankings_api_version_major_minor,
+                underscored_patch=underscored_patch,
+                ugg_queue_name=current_queue.ugg_queue_name,
+                champion_id=champion_id,
+                ugg_rankings_api_version=ugg_rankings_api_version,
+            ),
+        )
+        # only the api versions are needed to build the urls, the rest are
+        # fetched concurrently
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            futures = [executor.submit(session.get, url) for url in urls]
+            responses = [future.result() for future in futures]
+
         try:
-            self.primary_roles = (
-                session.get(
-                    self.UGG_PRIMARY_ROLES.format(
-                        ugg_primary_roles_api_version_major_minor=ugg_primary_roles_api_version_major_minor,
-                        underscored_patch=underscored_patch,
-                        ugg_primary_roles_api_version=ugg_primary_roles_api_version,
-                    )
-                )
-                .json()
-                .get(champion_id)
+            primary_roles, self.overview, self.rankings = (
+                response_json(r) for r in responses
             )
-            # champion exists this patch that did not exist last patch
-            if self.primary_roles is None:
-                raise NoDataError(
-                    f"No primary roles, champion={Champions.name_for_id(champion_id)}, "
-                    f"queue={current_queue}, "
-                    f"rank={current_queue.rank}, "
-                    f"patch={underscored_patch}, "
-                    f"ugg_primary_roles_api_version={ugg_primary_roles_api_version}"
-                )
-            self.overview = session.get(
-                self.UGG_OVERVIEW.format(
-                    ugg_overview_api_version_major_minor=ugg_overview_api_version_major_minor,
-                    underscored_patch=underscored_patch,
-                    ugg_queue_name=current_queue.ugg_queue_name,
-                    champion_id=champion_id,
-                    ugg_overview_api_version=ugg_overview_api_version,
-                )
-            ).json()
-            self.rankings = session.get(
-                self.UGG_RANKINGS.format(
-                    ugg_rankings_api_version_major_minor=ugg_rankings_api_version_major_minor,
-                    underscored_patch=underscored_patch,
-                    ugg_queue_name=current_queue.ugg_queue_name,
-                    champion_id=champion_id,
-                    ugg_rankings_api_version=ugg_rankings_api_version,
-                )
-            ).json()
         except JSONDecodeError:
             raise NoDataError(
                 f"No data, champion={Champions.name_for_id(champion_id)}, "
@@ -125,6 +118,17 @@ class Fetcher:
                 f"patch={underscored_patch}"
             )
 
+        self.primary_roles = primary_roles.get(champion_id)
+        # champion exists this patch that did not exist last patch
+        if self.primary_roles is None:
+            raise NoDataError(
+                f"No primary roles, champion={Champions.name_for_id(champion_id)}, "
+                f"queue={current_queue}, "
+                f"rank={current_queue.rank}, "
+                f"patch={underscored_patch}, "
+                f"ugg_primary_roles_api_version={ugg_primary_roles_api_version}"
+            )
+
     @staticmethod
     def convert_version_to_major_minor(version: str) -> str:
         return ".".join(version.split(".")[:2])
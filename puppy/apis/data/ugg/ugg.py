@@ -1,8 +1,8 @@
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Iterable
 from functools import lru_cache
 
 from puppy.apis.data.data_source import DataSourceAbc
-from puppy.apis.data.exceptions import NoDataError
+from puppy.apis.data.patch_data import fetch_patch_data
 from puppy.apis.data.ugg.fetcher import Fetcher
 from puppy.config import config
 from puppy.apis import Patches, Runes, Item
@@ -17,7 +17,6 @@ from puppy.models import (
 )
 from puppy.static import (
     ABILITIES,
-    MIN_ACCEPTABLE_PATCH_MATCH_RATIO,
     FLASH,
     SUMMONERS_RIFT,
 )
@@ -37,61 +36,24 @@ class UGG(DataSourceAbc):
         self.current_queue = current_queue
         self.assigned_role = assigned_role
 
-        try:
-            current_patch_data = Fetcher(
-                champion_id,
-                current_queue,
-                Patches.get_format_underscore_current_patch(),
-            )
-        except NoDataError:
-            print("No data on current patch, attempting to revert to previous patch")
-            self.fetcher = Fetcher(
-                champion_id,
-                current_queue,
-                Patches.get_format_underscore_previous_patch(),
-            )
-            return
-
-        if config.revert_patch:
-            try:
-                previous_patch_data = Fetcher(
-                    champion_id,
-                    current_queue,
-                    Patches.get_format_underscore_previous_patch(),
-                )
-            except NoDataError:
-                print("No data from previous patch")
-                self.fetcher = current_patch_data
-                return
-
-            current_patch_matches = 0
-            previous_patch_matches = 0
-            for role in set(previous_patch_data.current_queue_available_roles()) & set(
-                current_patch_data.current_queue_available_roles()
-            ):
-                data = current_patch_data.rankings_data("world", role)
-                current_patch_matches += data["matches"]
-                data = previous_patch_data.rankings_data("world", role)
-                previous_patch_matches += data["matches"]
-
-            # use current patch only if max match count of any role in current patch is at least n% of
-            # the max match count in any role on the previous patch
-            if (
-                current_patch_matches / previous_patch_matches
-                > MIN_ACCEPTABLE_PATCH_MATCH_RATIO
-            ):
-                print(
-                    f"Using current patch's data ({current_patch_matches}/{previous_patch_matches} = {current_patch_matches / previous_patch_matches:.2f})"
-                )
-                self.fetcher = current_patch_data
-            else:
-                print(
-                    f"Reverting to previous patch data ({current_patch_matches}/{previous_patch_matches} = {current_patch_matches / previous_patch_matches:.2f})"
-                )
-                self.fetcher = previous_patch_data
-        else:
-            # no reversion, use current patch
-            self.fetcher = current_patch_data
+        self.fetcher = fetch_patch_data(
+            lambda patch: Fetcher(champion_id, current_queue, patch),
+            self.count_matches,
+            Patches.get_format_underscore_current_patch(),
+            Patches.get_format_underscore_previous_patch(),
+            config.revert_patch,
+        )
+
+    @staticmethod
+    def count_matches(fetcher: Fetcher, roles: Iterable[Role]) -> int:
+        """
+        Returns the number of matches played in roles
+
+        fetcher - fetcher of a patch's data
+        roles - roles to count matches of
+        """
+
+        return sum(fetcher.rankings_data("world", role)["matches"] for role in roles)
 
     @lru_cache()
     def get_roles(self) -> RoleList:
@@ -4,3 +4,6 @@ from .runes import Runes
 from .map import Map
 from .item import Item
 from .summoner import Summoner
+from .static_data import StaticData, DdragonSource
+from .lcu_source import LcuSource
+from .prefetch import prefetch
@@ -0,0 +1,149 @@
+import json
+import marshal
+import os
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import requests
+
+from puppy.apis.json_codec import response_json
+
+
+CACHE_DIRECTORY = "ddragon_cache"  # name of directory to store cached static data in
+DATA_URL = "http://ddragon.leagueoflegends.com/cdn/{patch}/data/en_US/{filename}"
+SNAPSHOT_VERSION = 2  # increment when the data kept in snapshots changes
+# marshal data is only readable by the python version that wrote it
+SNAPSHOT_HEADER = (SNAPSHOT_VERSION, marshal.version, tuple(sys.version_info[:2]))
+
+
+class DdragonCache:
+    """
+    On disk cache of static ddragon data
+    Data is stored as compact snapshots in one directory per patch:
+        <cache directory>/<patch>/<filename>.snapshot
+    """
+
+    def __init__(self, directory: str = CACHE_DIRECTORY):
+        """
+        directory - path of directory to store cached data in
+        """
+
+        self.directory = Path(directory)
+
+    def get(self, filename: str, patch: str, project: Callable[[Any], Any]) -> Any:
+        """
+        Returns the projected contents of a ddragon data file
+        Reads the snapshot from disk if it is cached,
+            otherwise downloads the file and caches a snapshot of its projection
+
+        filename - name of ddragon data file (e.g. "champion.json")
+        patch - patch to get data for
+        project - function that reduces the parsed file to the data that is used
+        """
+
+        relative_path = Path(patch, f"{filename}.snapshot")
+        data = self.read_snapshot(relative_path)
+        if data is not None:
+            return data
+
+        data = project(
+            response_json(
+                requests.get(DATA_URL.format(patch=patch, filename=filename))
+            )
+        )
+        self.write_snapshot(relative_path, data)
+        self.remove_old_patches(patch)
+        return data
+
+    def read_snapshot(self, relative_path: Path) -> Any:
+        """
+        Returns the data stored in a snapshot
+        Returns None if the snapshot is not cached, is unreadable,
+            or was written by a different snapshot or python version
+
+        relative_path - path of snapshot relative to the cache directory
+        """
+
+        try:
+            with open(self.directory / relative_path, "rb") as f:
+                header, data = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            # missing, partially written, or corrupted
+            return None
+        if header != SNAPSHOT_HEADER:
+            return None
+        return data
+
+    def write_snapshot(self, relative_path: Path, data: Any):
+        """
+        Atomically writes data to a snapshot
+
+        relative_path - path of snapshot relative to the cache directory
+        data - data made of only builtin types to write
+        """
+
+        self.write_bytes(relative_path, marshal.dumps((SNAPSHOT_HEADER, data)))
+
+    def read(self, relative_path: Path, max_age: Optional[float] = None) -> Any:
+        """
+        Returns the parsed contents of a cached json file
+        Returns None if the file is not cached, is unreadable, or is older than max_age
+
+        relative_path - path of file relative to the cache directory
+        max_age - maximum age of file in seconds, None for no limit
+        """
+
+        path = self.directory / relative_path
+        try:
+            if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            # missing, partially written, or corrupted
+            return None
+
+    def write(self, relative_path: Path, data: Any):
+        """
+        Atomically writes data to a cached file as json
+
+        relative_path - path of file relative to the cache directory
+        data - json serializable data to write
+        """
+
+        self.write_bytes(relative_path, json.dumps(data).encode("utf-8"))
+
+    def write_bytes(self, relative_path: Path, contents: bytes):
+        """
+        Atomically writes bytes to a cached file
+
+        relative_path - path of file relative to the cache directory
+        contents - bytes to write
+        """
+
+        path = self.directory / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(
+            f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with open(temp_path, "wb") as f:
+            f.write(contents)
+        os.replace(temp_path, path)
+
+    def remove_old_patches(self, current_patch: str):
+        """
+        Deletes cached data for every patch except the current patch
+
+        current_patch - patch whose data should be kept
+        """
+
+        for child in self.directory.iterdir():
+            if child.is_dir() and child.name != current_patch:
+                shutil.rmtree(child, ignore_errors=True)
+
+
+ddragon_cache = DdragonCache()
@@ -1,9 +1,10 @@
 import string
 from functools import lru_cache
-from typing import Optional
-
-import requests
+from typing import Any, Dict, Optional, Tuple
 
+from .lazy import lazy_attribute
+from .record import StaticRecord
+from .static_data import StaticData
 from .patches import Patches
 
 
@@ -12,8 +13,79 @@ class Champions:
     Manipulation of static champion data
     """
 
-    CHAMPIONS_URL = f"http://ddragon.leagueoflegends.com/cdn/{Patches.get_current_patch()}/data/en_US/champion.json"
-    champions = requests.get(CHAMPIONS_URL).json()["data"]
+    CHAMPIONS_FILENAME = "champion.json"
+
+    @lazy_attribute
+    def champions(cls) -> Tuple[StaticRecord, ...]:
+        """
+        Records of all champions
+        """
+
+        return StaticRecord.from_tuples(
+            StaticData.get(cls.CHAMPIONS_FILENAME, cls.project)
+        )
+
+    @staticmethod
+    def project(data: Dict[str, Any]) -> Tuple[Tuple[str, str, str], ...]:
+        """
+        Reduces champion.json to (id, name, alternate name) tuples
+        """
+
+        return tuple(
+            (champion["key"], champion["name"], champion["id"])
+            for champion in data["data"].values()
+        )
+
+    @lazy_attribute
+    def names_by_id(cls) -> Dict[str, str]:
+        """
+        Mapping of champion id to name
+        """
+
+        return {champion.id: champion.name for champion in cls.champions}
+
+    @lazy_attribute
+    def alternate_names_by_id(cls) -> Dict[str, str]:
+        """
+        Mapping of champion id to alternate name
+        """
+
+        return {champion.id: champion.alternate_name for champion in cls.champions}
+
+    @lazy_attribute
+    def ids_by_name(cls) -> Dict[str, str]:
+        """
+        Mapping of normalized champion name to id
+        """
+
+        ids_by_name = {}
+        for champion in cls.champions:
+            ids_by_name.setdefault(cls.normalize_name(champion.name), champion.id)
+        return ids_by_name
+
+    @lazy_attribute
+    def names_by_name(cls) -> Dict[str, str]:
+        """
+        Mapping of normalized champion name to name
+        """
+
+        names_by_name = {}
+        for champion in cls.champions:
+            names_by_name.setdefault(cls.normalize_name(champion.name), champion.name)
+        return names_by_name
+
+    @lazy_attribute
+    def ids_by_alternate_name(cls) -> Dict[str, str]:
+        """
+        Mapping of normalized champion alternate name to id
+        """
+
+        ids_by_alternate_name = {}
+        for champion in cls.champions:
+            ids_by_alternate_name.setdefault(
+                cls.remove_punctuation(champion.alternate_name).casefold(), champion.id
+            )
+        return ids_by_alternate_name
 
     @classmethod
     @lru_cache()
@@ -25,11 +97,7 @@ class Champions:
         name - full name of champion
         """
 
-        for champion in cls.champions.values():
-            if cls.remove_punctuation(champion["name"]).casefold().replace(
-                " ", ""
-            ) == cls.remove_punctuation(name).casefold().replace(" ", ""):
-                return champion["key"]
+        return cls.ids_by_name.get(cls.normalize_name(name))
 
     @classmethod
     @lru_cache()
@@ -41,9 +109,7 @@ class Champions:
         champion_id - id of champion
         """
 
-        for champion in cls.champions.values():
-            if champion["key"] == champion_id:
-                return champion["name"]
+        return cls.names_by_id.get(champion_id)
 
     @classmethod
     @lru_cache()
@@ -52,7 +118,7 @@ class Champions:
         Corrects the champion name given a name missing spaces, capital letters, or punctuation
         """
 
-        return cls.name_for_id(cls.id_for_name(name))
+        return cls.names_by_name.get(cls.normalize_name(name))
 
     @classmethod
     @lru_cache()
@@ -65,9 +131,7 @@ class Champions:
         champion_id - id of champion
         """
 
-        for champion in cls.champions.values():
-            if champion["key"] == champion_id:
-                return champion["id"]
+        return cls.alternate_names_by_id.get(champion_id)
 
     @classmethod
     @lru_cache()
@@ -80,12 +144,9 @@ class Champions:
         alternate_name - alternate_name of champion
         """
 
-        for champion in cls.champions.values():
-            if (
-                cls.remove_punctuation(champion["id"]).casefold()
-                == cls.remove_punctuation(alternate_name).casefold()
-            ):
-                return champion["key"]
+        return cls.ids_by_alternate_name.get(
+            cls.remove_punctuation(alternate_name).casefold()
+        )
 
     @classmethod
     @lru_cache()
@@ -106,3 +167,13 @@ class Champions:
         """
 
         return text.translate(str.maketrans("", "", string.punctuation))
+
+    @classmethod
+    def normalize_name(cls, name: str) -> str:
+        """
+        Removes punctuation, capital letters, and spaces from a champion name
+
+        name - name of champion
+        """
+
+        return cls.remove_punctuation(name).casefold().replace(" ", "")
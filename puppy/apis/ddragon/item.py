@@ -1,10 +1,9 @@
 from functools import lru_cache
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 import string
 
-import requests
-
-from .patches import Patches
+from .lazy import lazy_attribute
+from .static_data import StaticData
 
 
 def transform_name(name: str) -> str:
@@ -22,14 +21,36 @@ class Item:
     Manipulation of static item data
     """
 
-    ITEM_URL = f"http://ddragon.leagueoflegends.com/cdn/{Patches.get_current_patch()}/data/en_US/item.json"
-    items = requests.get(ITEM_URL).json()
-    id_name = {
-        item_id: item_data["name"] for item_id, item_data in items["data"].items()
-    }
-    name_id = {
-        transform_name(item_name): item_id for item_id, item_name in id_name.items()
-    }
+    ITEM_FILENAME = "item.json"
+
+    @lazy_attribute
+    def id_name(cls) -> Dict[str, str]:
+        """
+        Mapping of item id to item name
+        """
+
+        return dict(StaticData.get(cls.ITEM_FILENAME, cls.project))
+
+    @staticmethod
+    def project(data: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+        """
+        Reduces item.json to (id, name) tuples
+        """
+
+        return tuple(
+            (item_id, item_data["name"]) for item_id, item_data in data["data"].items()
+        )
+
+    @lazy_attribute
+    def name_id(cls) -> Dict[str, str]:
+        """
+        Mapping of transformed item name to item id
+        """
+
+        return {
+            transform_name(item_name): item_id
+            for item_id, item_name in cls.id_name.items()
+        }
 
     @classmethod
     @lru_cache()
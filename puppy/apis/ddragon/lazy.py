@@ -0,0 +1,38 @@
+import threading
+from typing import Any, Callable
+
+
+class LazyAttribute:
+    """
+    Class attribute whose value is loaded on first access
+    Loading is thread safe and happens at most once
+    """
+
+    def __init__(self, loader: Callable[[Any], Any]):
+        """
+        loader - function that takes the owner class and returns the value
+        """
+
+        self.loader = loader
+        self.__doc__ = loader.__doc__
+        self.lock = threading.Lock()
+        self.loaded = False
+        self.value = None
+
+    def __get__(self, instance: Any, owner: Any) -> Any:
+        if not self.loaded:
+            with self.lock:
+                # another thread may have loaded while we waited for the lock
+                if not self.loaded:
+                    self.value = self.loader(owner)
+                    self.loaded = True
+        return self.value
+
+
+def lazy_attribute(loader: Callable[[Any], Any]) -> LazyAttribute:
+    """
+    Decorator that turns a function taking the owner class
+        into a lazily loaded class attribute
+    """
+
+    return LazyAttribute(loader)
@@ -0,0 +1,210 @@
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+from puppy.apis.client import Lcu
+from puppy.apis.json_codec import response_json
+from .static_data import StaticDataSourceAbc, DdragonSource
+
+
+# locale of ddragon data, which names in the config are checked against
+DDRAGON_LOCALE = "en_US"
+# files whose names or keys are looked up, served by ddragon if the client
+# is in another language
+LOCALIZED_FILENAMES = ("item.json", "runesReforged.json")
+# ddragon keys of runes that are not built from their name
+RUNE_KEYS = {
+    8008: "LethalTempoTemp",
+    8401: "MirrorShell",
+    8439: "VeteranAftershock",
+}
+# ddragon alternate names of summoner spells, which are not built from their name
+SUMMONER_ALTERNATE_NAMES = {
+    1: "SummonerBoost",
+    3: "SummonerExhaust",
+    4: "SummonerFlash",
+    6: "SummonerHaste",
+    7: "SummonerHeal",
+    11: "SummonerSmite",
+    12: "SummonerTeleport",
+    13: "SummonerMana",
+    14: "SummonerDot",
+    21: "SummonerBarrier",
+    30: "SummonerPoroRecall",
+    31: "SummonerPoroThrow",
+    32: "SummonerSnowball",
+    39: "SummonerSnowURFSnowball_Mark",
+}
+
+
+def key_for_name(name: str) -> str:
+    """
+    Builds a ddragon style key from a display name
+        (eg. "Press the Attack" is "PressTheAttack")
+    """
+
+    # apostrophes do not split words (eg. "Future's Market" is "FuturesMarket")
+    words = re.split(r"[^0-9A-Za-z]+", name.replace("'", ""))
+    return "".join(word[0].upper() + word[1:] for word in words if word)
+
+
+class LcuSource(StaticDataSourceAbc):
+    """
+    Static data served by the local League client
+    Data always matches the installed client version and needs no internet access
+    Falls back to ddragon for data the client fails to serve, and for item and
+        rune data if the client is not in english, as names and keys from
+        that data are matched against english names
+    """
+
+    def __init__(self, lcu: Lcu):
+        """
+        lcu - connector for the running League client
+        """
+
+        self.lcu = lcu
+        self.fallback = DdragonSource()
+        self.locale: Optional[str] = None
+        self.converters = {
+            "champion.json": self.get_champions,
+            "runesReforged.json": self.get_runes,
+            "item.json": self.get_items,
+            "map.json": self.get_maps,
+            "summoner.json": self.get_summoners,
+        }
+
+    def get(self, filename: str, project: Callable[[Any], Any]) -> Any:
+        try:
+            if filename in LOCALIZED_FILENAMES:
+                locale = self.get_locale()
+                if locale != DDRAGON_LOCALE:
+                    print(f"League client is in {locale}, using ddragon for {filename}")
+                    return self.fallback.get(filename, project)
+            return project(self.converters[filename]())
+        except Exception as e:
+            print(
+                f"Unable to get {filename} from the League client ({e}), using ddragon"
+            )
+            return self.fallback.get(filename, project)
+
+    def get_locale(self) -> str:
+        """
+        Returns the locale of the client's game data (e.g. "en_US")
+        """
+
+        if self.locale is None:
+            r = self.lcu.get(["riotclient", "region-locale"])
+            r.raise_for_status()
+            self.locale = response_json(r)["locale"]
+        return self.locale  # type: ignore
+
+    def get_asset(self, asset_filename: str) -> Any:
+        """
+        Returns parsed json of a lol-game-data asset
+
+        asset_filename - name of asset file (e.g. "champion-summary.json")
+        """
+
+        r = self.lcu.get(["lol-game-data", "assets", "v1", asset_filename])
+        r.raise_for_status()
+        return response_json(r)
+
+    def get_champions(self) -> Dict[str, Any]:
+        """
+        Returns champion data in the format of ddragon champion.json
+        """
+
+        data = {}
+        for champion in self.get_asset("champion-summary.json"):
+            if champion["id"] < 0:
+                continue  # placeholder for no champion
+            data[champion["alias"]] = {
+                "key": str(champion["id"]),
+                "name": champion["name"],
+                "id": champion["alias"],
+            }
+        return {"data": data}
+
+    def get_runes(self) -> List[Dict[str, Any]]:
+        """
+        Returns rune data in the format of ddragon runesReforged.json
+        """
+
+        perks = {perk["id"]: perk for perk in self.get_asset("perks.json")}
+
+        trees = []
+        for style in self.get_asset("perkstyles.json")["styles"]:
+            slots = []
+            for slot in style["slots"]:
+                # shards are not part of the ddragon rune trees
+                if slot["type"] == "kStatMod":
+                    continue
+                slots.append(
+                    {
+                        "runes": [
+                            {
+                                "id": perk_id,
+                                "key": RUNE_KEYS.get(
+                                    perk_id, key_for_name(perks[perk_id]["name"])
+                                ),
+                                "name": perks[perk_id]["name"],
+                            }
+                            for perk_id in slot["perks"]
+                        ]
+                    }
+                )
+            trees.append(
+                {
+                    "id": style["id"],
+                    "key": key_for_name(style["name"]),
+                    "name": style["name"],
+                    "slots": slots,
+                }
+            )
+        return trees
+
+    def get_items(self) -> Dict[str, Any]:
+        """
+        Returns item data in the format of ddragon item.json
+        """
+
+        return {
+            "data": {
+                str(item["id"]): {"name": item["name"]}
+                for item in self.get_asset("items.json")
+            }
+        }
+
+    def get_maps(self) -> Dict[str, Any]:
+        """
+        Returns map data in the format of ddragon map.json
+        """
+
+        return {
+            "data": {
+                str(league_map["id"]): {
+                    "MapId": str(league_map["id"]),
+                    "MapName": league_map["name"],
+                }
+                for league_map in self.get_asset("maps.json")
+            }
+        }
+
+    def get_summoners(self) -> Dict[str, Any]:
+        """
+        Returns summoner spell data in the format of ddragon summoner.json
+        The client does not serve ddragon alternate names for summoner spells,
+            so they are looked up by id, or built from the name for spells
+            missing from SUMMONER_ALTERNATE_NAMES (eg. Flash is "SummonerFlash")
+        """
+
+        data = {}
+        for summoner in self.get_asset("summoner-spells.json"):
+            alternate_name = SUMMONER_ALTERNATE_NAMES.get(
+                summoner["id"], "Summoner" + key_for_name(summoner["name"])
+            )
+            data[alternate_name] = {
+                "key": str(summoner["id"]),
+                "name": summoner["name"],
+                "id": alternate_name,
+            }
+        return {"data": data}
@@ -1,9 +1,8 @@
 from functools import lru_cache
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
-import requests
-
-from .patches import Patches
+from .lazy import lazy_attribute
+from .static_data import StaticData
 
 
 class Map:
@@ -11,8 +10,26 @@ class Map:
     Manipulation of static map data
     """
 
-    MAP_URL = f"http://ddragon.leagueoflegends.com/cdn/{Patches.get_current_patch()}/data/en_US/map.json"
-    maps = requests.get(MAP_URL).json()
+    MAP_FILENAME = "map.json"
+
+    @lazy_attribute
+    def maps(cls) -> Tuple[Tuple[str, str], ...]:
+        """
+        (id, name) tuples of all maps
+        """
+
+        return StaticData.get(cls.MAP_FILENAME, cls.project)
+
+    @staticmethod
+    def project(data: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+        """
+        Reduces map.json to (id, name) tuples
+        """
+
+        return tuple(
+            (league_map["MapId"], league_map["MapName"])
+            for league_map in data["data"].values()
+        )
 
     @classmethod
     @lru_cache()
@@ -24,10 +41,9 @@ class Map:
         name - full name of map
         """
 
-        # name map is reserved
-        for league_map in cls.maps["data"].values():
-            if league_map["MapName"].casefold() == name.casefold():
-                return league_map["MapId"]
+        for map_id, map_name in cls.maps:
+            if map_name.casefold() == name.casefold():
+                return map_id
 
     @classmethod
     @lru_cache()
@@ -39,7 +55,6 @@ class Map:
         map_id - id of map
         """
 
-        # name map is reserved
-        for league_map in cls.maps["data"].values():
-            if league_map["MapId"] == map_id:
-                return league_map["MapName"]
+        for league_map_id, map_name in cls.maps:
+            if league_map_id == map_id:
+                return map_name
@@ -1,6 +1,16 @@
-from typing import List
+import re
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
 
 import requests
+from requests.exceptions import RequestException
+
+from puppy.apis.client import Lcu
+from puppy.apis.client.exceptions import LeagueProcessNotFoundError
+from puppy.apis.json_codec import response_json
+from .cache import ddragon_cache
 
 
 class Patches:
@@ -8,13 +18,141 @@ class Patches:
     Manipulation of static patch data
     """
 
+    PATCHES_URL = "http://ddragon.leagueoflegends.com/api/versions.json"
+    PATCHES_FILENAME = "versions.json"
+    ttl = 600  # seconds that the patch list is reused for before it is fetched again
+    fetch_count = 0  # number of times the patch list has been downloaded
+    all_patches: Optional[List[str]] = None
+    fetched_at = 0.0
+    lock = threading.Lock()
+    lcu: Optional[Lcu] = None  # client to read the current patch from
+    client_patch: Optional[str] = None  # major and minor parts of client patch
+    # auth token of the client that client_patch was read from (even if it could
+    # not be read), the client may have restarted on a new patch since
+    client_patch_key: Optional[str] = None
+
     @classmethod
     def get_all_patches(cls) -> List[str]:
         """
         Returns list of all patches
+        The list is memoized for ttl seconds
         """
-        PATCHES_URL = "http://ddragon.leagueoflegends.com/api/versions.json"
-        return requests.get(PATCHES_URL).json()
+
+        with cls.lock:
+            if (
+                cls.all_patches is None
+                or time.monotonic() - cls.fetched_at >= cls.ttl
+            ):
+                cls.all_patches = cls.fetch_all_patches()
+                cls.fetched_at = time.monotonic()
+            return cls.all_patches
+
+    @classmethod
+    def fetch_all_patches(cls) -> List[str]:
+        """
+        Returns list of all patches from disk if it was saved within ttl seconds,
+            otherwise downloads it
+        Falls back to the last saved list if the download fails
+        """
+
+        cached_patches = ddragon_cache.read(
+            Path(cls.PATCHES_FILENAME), max_age=cls.ttl
+        )
+        if cached_patches is not None:
+            return cached_patches
+
+        try:
+            cls.fetch_count += 1
+            patches = response_json(requests.get(cls.PATCHES_URL))
+        except (RequestException, ValueError):
+            cached_patches = ddragon_cache.read(Path(cls.PATCHES_FILENAME))
+            if cached_patches is None:
+                raise
+            print("Unable to fetch patches, using saved patches")
+            return cached_patches
+
+        ddragon_cache.write(Path(cls.PATCHES_FILENAME), patches)
+        return patches
+
+    @classmethod
+    def use_client(cls, lcu: Lcu):
+        """
+        Uses the running League client to determine the current patch,
+            falling back to the ddragon patch list if the client version cannot be read
+
+        lcu - connector for the running League client
+        """
+
+        with cls.lock:
+            cls.lcu = lcu
+            cls.client_patch = None
+            cls.client_patch_key = None
+
+    @classmethod
+    def get_client_patch(cls) -> Optional[str]:
+        """
+        Returns the major and minor parts of the running client's patch
+        The patch is read once per client, and again if the client restarted,
+            as it may have updated
+        Returns None if no client is used or its version cannot be read
+        """
+
+        if cls.lcu is None:
+            return None
+        with cls.lock:
+            key = cls.lcu.auth.key
+            if cls.client_patch_key != key:
+                # a version that cannot be read is not requested again either
+                cls.client_patch = cls.read_client_patch(cls.lcu)
+                cls.client_patch_key = key
+            return cls.client_patch
+
+    @classmethod
+    def read_client_patch(cls, lcu: Lcu) -> Optional[str]:
+        """
+        Requests the major and minor parts of a client's patch
+        Returns None if its version cannot be read
+
+        lcu - connector for the running League client
+        """
+
+        try:
+            version = response_json(lcu.get(["lol-patch", "v1", "game-version"]))
+        except (LeagueProcessNotFoundError, ValueError):
+            return None
+        if not isinstance(version, str) or not re.match(r"\d+\.\d+", version):
+            return None
+        return cls.major_minor(version)
+
+    @classmethod
+    def get_current_major_minor(cls) -> str:
+        """
+        Returns the major and minor parts of the current patch
+        """
+
+        client_patch = cls.get_client_patch()
+        if client_patch is not None:
+            return client_patch
+        return cls.major_minor(cls.get_all_patches()[0])
+
+    @classmethod
+    def get_previous_major_minor(cls) -> str:
+        """
+        Returns the major and minor parts of the previous patch
+        """
+
+        client_patch = cls.get_client_patch()
+        if client_patch is None:
+            return cls.major_minor(cls.get_all_patches()[1])
+
+        major, minor = client_patch.split(".")
+        if int(minor) > 1:
+            return f"{major}.{int(minor) - 1}"
+        # first patch of a season, the previous patch is the newest one before it
+        for patch in cls.get_all_patches():
+            if cls.version_tuple(patch) < cls.version_tuple(client_patch):
+                return cls.major_minor(patch)
+        return cls.major_minor(cls.get_all_patches()[1])
 
     @classmethod
     def get_current_patch(cls) -> str:
@@ -22,7 +160,7 @@ class Patches:
         Returns current patch
         """
 
-        return cls.get_all_patches()[0]
+        return cls.ddragon_patch_for(cls.get_current_major_minor())
 
     @classmethod
     def get_previous_patch(cls) -> str:
@@ -30,7 +168,22 @@ class Patches:
         Returns the previous patch
         """
 
-        return cls.get_all_patches()[1]
+        return cls.ddragon_patch_for(cls.get_previous_major_minor())
+
+    @classmethod
+    def ddragon_patch_for(cls, major_minor: str) -> str:
+        """
+        Returns the newest ddragon patch with the given major and minor parts
+        Returns the newest ddragon patch if ddragon does not have the patch yet
+
+        major_minor - major and minor parts of patch
+        """
+
+        all_patches = cls.get_all_patches()
+        for patch in all_patches:
+            if cls.major_minor(patch) == major_minor:
+                return patch
+        return all_patches[0]
 
     @classmethod
     def get_format_underscore_current_patch(cls) -> str:
@@ -39,8 +192,7 @@ class Patches:
         Uses only the first 2 parts of the patch name
         """
 
-        current_patch = cls.get_current_patch()
-        return "_".join(current_patch.split(".")[:2])
+        return cls.get_current_major_minor().replace(".", "_")
 
     @classmethod
     def get_format_underscore_previous_patch(cls) -> str:
@@ -49,8 +201,15 @@ class Patches:
         Uses only the first 2 parts of the patch name
         """
 
-        previous_patch = cls.get_all_patches()[1]
-        return "_".join(previous_patch.split(".")[:2])
+        return cls.get_previous_major_minor().replace(".", "_")
+
+    @staticmethod
+    def version_tuple(patch: str) -> Tuple[int, ...]:
+        """
+        Returns the numeric parts of a patch as a tuple for comparison
+        """
+
+        return tuple(int(part) for part in patch.split(".") if part.isdigit())
 
     @staticmethod
     def major_minor(patch: str) -> str:
@@ -0,0 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Any, Tuple
+
+from .champions import Champions
+from .runes import Runes
+from .item import Item
+from .summoner import Summoner
+
+
+# (class, lazy attribute, filename) of data used during champ select
+# Map is not used during champ select and is left to load on first access
+DATASETS = (
+    (Champions, "champions", Champions.CHAMPIONS_FILENAME),
+    (Runes, "runes", Runes.RUNES_FILENAME),
+    (Item, "id_name", Item.ITEM_FILENAME),
+    (Summoner, "summoners", Summoner.SUMMONER_FILENAME),
+)
+
+
+def load(cls: Any, attribute: str) -> float:
+    """
+    Loads a lazy attribute of a class
+    Returns the time taken to load in seconds
+    """
+
+    start = time.perf_counter()
+    getattr(cls, attribute)
+    return time.perf_counter() - start
+
+
+def prefetch(debug: bool = False) -> Tuple[str, ...]:
+    """
+    Loads all static data used during champ select concurrently
+    Data that fails to load is skipped and loaded again on first access
+    Returns the filenames of data that failed to load
+
+    debug - whether to print the time taken to load each file
+    """
+
+    start = time.perf_counter()
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=len(DATASETS)) as executor:
+        futures = [
+            (filename, executor.submit(load, cls, attribute))
+            for cls, attribute, filename in DATASETS
+        ]
+        for filename, future in futures:
+            try:
+                elapsed = future.result()
+            except Exception as e:
+                print(f"Unable to prefetch {filename}: {e}")
+                failed.append(filename)
+                continue
+            if debug:
+                print(f"Loaded {filename} in {elapsed:.3f}s")
+
+    if debug:
+        print(f"Loaded static data in {time.perf_counter() - start:.3f}s")
+    return tuple(failed)
@@ -0,0 +1,33 @@
+from typing import Iterable, Tuple
+
+
+class StaticRecord:
+    """
+    Compact record of a champion or summoner spell
+    """
+
+    __slots__ = ("id", "name", "alternate_name")
+
+    def __init__(self, id: str, name: str, alternate_name: str):
+        """
+        id - id of champion or summoner spell (ddragon "key")
+        name - full name
+        alternate_name - alternate name (ddragon "id")
+        """
+
+        self.id = id
+        self.name = name
+        self.alternate_name = alternate_name
+
+    @classmethod
+    def from_tuples(
+        cls, records: Iterable[Tuple[str, str, str]]
+    ) -> Tuple["StaticRecord", ...]:
+        """
+        Builds records from (id, name, alternate name) tuples
+        """
+
+        return tuple(cls(*record) for record in records)
+
+    def __repr__(self) -> str:
+        return self.name
@@ -1,9 +1,23 @@
 from functools import lru_cache
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
-import requests
+from .lazy import lazy_attribute
+from .static_data import StaticData
 
-from .patches import Patches
+
+class RunePosition(NamedTuple):
+    """
+    Location of a rune in the rune trees
+    """
+
+    style: int  # id of rune tree style
+    row: int  # row in tree, indexed starting at 0
+    position: int  # position in row, indexed starting at 1
+    key: str  # name of rune
+
+
+# (style id, style name, rows), where each row is a tuple of (rune id, rune name)
+RuneTree = Tuple[int, str, Tuple[Tuple[Tuple[int, str], ...], ...]]
 
 
 class Runes:
@@ -11,8 +25,59 @@ class Runes:
     Manipulation of static runes data
     """
 
-    RUNES_URL = f"http://ddragon.leagueoflegends.com/cdn/{Patches.get_current_patch()}/data/en_US/runesReforged.json"
-    runes = requests.get(RUNES_URL).json()
+    RUNES_FILENAME = "runesReforged.json"
+
+    @lazy_attribute
+    def runes(cls) -> Tuple[RuneTree, ...]:
+        """
+        All rune trees
+        """
+
+        return StaticData.get(cls.RUNES_FILENAME, cls.project)
+
+    @staticmethod
+    def project(data: List[Dict[str, Any]]) -> Tuple[RuneTree, ...]:
+        """
+        Reduces runesReforged.json to rune trees
+        """
+
+        return tuple(
+            (
+                tree["id"],
+                tree["name"],
+                tuple(
+                    tuple((rune["id"], rune["key"]) for rune in slot["runes"])
+                    for slot in tree["slots"]
+                ),
+            )
+            for tree in data
+        )
+
+    @lazy_attribute
+    def rune_positions(cls) -> Dict[int, RunePosition]:
+        """
+        Mapping of rune id to its position in the rune trees
+        """
+
+        rune_positions = {}
+        for style, _, rows in cls.runes:
+            for row, row_runes in enumerate(rows):
+                for i, (rune_id, key) in enumerate(row_runes):
+                    rune_positions.setdefault(
+                        rune_id, RunePosition(style, row, i + 1, key)
+                    )
+        return rune_positions
+
+    @lazy_attribute
+    def rune_ids_by_key(cls) -> Dict[str, int]:
+        """
+        Mapping of casefolded rune name to rune id
+        """
+
+        rune_ids_by_key = {}
+        for rune_id, rune_position in cls.rune_positions.items():
+            rune_ids_by_key.setdefault(rune_position.key.casefold(), rune_id)
+        return rune_ids_by_key
 
     @classmethod
     @lru_cache()
@@ -27,15 +92,11 @@ class Runes:
         """
 
         all_rune_trees = dict()
-        for tree in cls.runes:
-            tree_style = tree["id"]
+        for tree_style, _, rows in cls.runes:
             all_rune_trees[tree_style] = []
-
-            slots = tree["slots"]
-            for slot in slots:
-                runes = slot["runes"]
-                for rune in runes:
-                    all_rune_trees[tree_style].append(rune["id"])
+            for row_runes in rows:
+                for rune_id, _ in row_runes:
+                    all_rune_trees[tree_style].append(rune_id)
 
         return all_rune_trees
 
@@ -48,10 +109,9 @@ class Runes:
         Returns None if it does not exist
         """
 
-        all_rune_trees = cls.get_all_rune_trees()
-        for tree_style, runes in all_rune_trees.items():
-            if rune in runes:
-                return tree_style
+        rune_position = cls.rune_positions.get(rune)
+        if rune_position is not None:
+            return rune_position.style
 
     @classmethod
     @lru_cache()
@@ -63,9 +123,9 @@ class Runes:
         style_id - id of the rune tree style
         """
 
-        for tree in cls.runes:
-            if tree["id"] == style_id:
-                return tree["name"]
+        for tree_style, style_name, _ in cls.runes:
+            if tree_style == style_id:
+                return style_name
 
     @classmethod
     @lru_cache()
@@ -81,25 +141,22 @@ class Runes:
         secondary_style - style of secondary runes in runes lists
         """
 
-        # find primary and secondary runes
-        all_rune_trees = cls.get_all_rune_trees()
-        primary_runes = [
-            rune for rune in runes if cls.style_for_rune(rune) == primary_style
-        ]
-        secondary_runes = [
-            rune for rune in runes if cls.style_for_rune(rune) == secondary_style
-        ]
-
-        # sort both primary and secondary runes by order in tree
-        sorted_primary_runes = sorted(
-            primary_runes, key=lambda i: all_rune_trees[primary_style].index(i)
-        )
-        sorted_secondary_runes = sorted(
-            secondary_runes, key=lambda i: all_rune_trees[secondary_style].index(i)
+        # runes are ordered by row then position in row within each tree
+        rune_positions = cls.rune_positions
+        return sorted(
+            (
+                rune
+                for rune in runes
+                if rune in rune_positions
+                and rune_positions[rune].style in (primary_style, secondary_style)
+            ),
+            key=lambda rune: (
+                rune_positions[rune].style != primary_style,
+                rune_positions[rune].row,
+                rune_positions[rune].position,
+            ),
         )
 
-        return sorted_primary_runes + sorted_secondary_runes
-
     @classmethod
     @lru_cache()
     def id_for_name(cls, name: str) -> Optional[int]:
@@ -110,11 +167,7 @@ class Runes:
         name - name of rune
         """
 
-        for tree in cls.runes:
-            for slot in tree["slots"]:
-                for rune in slot["runes"]:
-                    if rune["key"].casefold() == name.casefold():
-                        return rune["id"]
+        return cls.rune_ids_by_key.get(name.casefold())
 
     @classmethod
     @lru_cache()
@@ -126,11 +179,9 @@ class Runes:
         rune_id - id of rune
         """
 
-        for tree in cls.runes:
-            for slot in tree["slots"]:
-                for rune in slot["runes"]:
-                    if rune["id"] == rune_id:
-                        return rune["key"]
+        rune_position = cls.rune_positions.get(rune_id)
+        if rune_position is not None:
+            return rune_position.key
 
     @classmethod
     @lru_cache()
@@ -143,11 +194,9 @@ class Runes:
         rune_id - id of rune
         """
 
-        for tree in cls.runes:
-            for slot in tree["slots"]:
-                for i, rune in enumerate(slot["runes"]):
-                    if rune["id"] == rune_id:
-                        return i + 1
+        rune_position = cls.rune_positions.get(rune_id)
+        if rune_position is not None:
+            return rune_position.position
 
     @classmethod
     @lru_cache()
@@ -160,8 +209,6 @@ class Runes:
         rune_id - id of rune
         """
 
-        for tree in cls.runes:
-            for i, slot in enumerate(tree["slots"]):
-                for rune in slot["runes"]:
-                    if rune["id"] == rune_id:
-                        return i
+        rune_position = cls.rune_positions.get(rune_id)
+        if rune_position is not None:
+            return rune_position.row
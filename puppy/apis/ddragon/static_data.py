@@ -0,0 +1,59 @@
+import abc
+from typing import Any, Callable
+
+from .cache import ddragon_cache
+from .patches import Patches
+
+
+class StaticDataSourceAbc(abc.ABC):
+    @abc.abstractmethod
+    def get(self, filename: str, project: Callable[[Any], Any]) -> Any:
+        """
+        Returns the projected contents of a static data file
+
+        filename - name of ddragon data file (e.g. "champion.json")
+        project - function that reduces data in the format used by ddragon
+            to the data that is used
+        """
+
+        pass
+
+
+class DdragonSource(StaticDataSourceAbc):
+    """
+    Static data from ddragon for the current patch, cached on disk
+    """
+
+    def get(self, filename: str, project: Callable[[Any], Any]) -> Any:
+        return ddragon_cache.get(filename, Patches.get_current_patch(), project)
+
+
+class StaticData:
+    """
+    Source of static data used by the static data classes
+    """
+
+    source: StaticDataSourceAbc = DdragonSource()
+
+    @classmethod
+    def use(cls, source: StaticDataSourceAbc):
+        """
+        Sets the source of static data
+        Only data that has not been loaded yet is affected
+
+        source - source to load static data from
+        """
+
+        cls.source = source
+
+    @classmethod
+    def get(cls, filename: str, project: Callable[[Any], Any]) -> Any:
+        """
+        Returns the projected contents of a static data file from the current source
+
+        filename - name of ddragon data file (e.g. "champion.json")
+        project - function that reduces data in the format used by ddragon
+            to the data that is used
+        """
+
+        return cls.source.get(filename, project)
@@ -1,8 +1,9 @@
 from functools import lru_cache
-from typing import Optional
-
-import requests
+from typing import Any, Dict, Optional, Tuple
 
+from .lazy import lazy_attribute
+from .record import StaticRecord
+from .static_data import StaticData
 from .patches import Patches
 
 
@@ -11,8 +12,28 @@ class Summoner:
     Manipulation of static summoner spell data
     """
 
-    SUMMONER_URL = f"http://ddragon.leagueoflegends.com/cdn/{Patches.get_current_patch()}/data/en_US/summoner.json"
-    summoners = requests.get(SUMMONER_URL).json()
+    SUMMONER_FILENAME = "summoner.json"
+
+    @lazy_attribute
+    def summoners(cls) -> Tuple[StaticRecord, ...]:
+        """
+        Records of all summoner spells
+        """
+
+        return StaticRecord.from_tuples(
+            StaticData.get(cls.SUMMONER_FILENAME, cls.project)
+        )
+
+    @staticmethod
+    def project(data: Dict[str, Any]) -> Tuple[Tuple[str, str, str], ...]:
+        """
+        Reduces summoner.json to (id, name, alternate name) tuples
+        """
+
+        return tuple(
+            (summoner["key"], summoner["name"], summoner["id"])
+            for summoner in data["data"].values()
+        )
 
     @classmethod
     @lru_cache()
@@ -24,9 +45,9 @@ class Summoner:
         name - full name of summoner spell
         """
 
-        for summoner in cls.summoners["data"].values():
-            if summoner["name"].casefold() == name.casefold():
-                return summoner["key"]
+        for summoner in cls.summoners:
+            if summoner.name.casefold() == name.casefold():
+                return summoner.id
 
     @classmethod
     @lru_cache()
@@ -38,9 +59,9 @@ class Summoner:
         summoner_id - id of summoner spell
         """
 
-        for summoner in cls.summoners["data"].values():
-            if summoner["key"] == summoner_id:
-                return summoner["name"]
+        for summoner in cls.summoners:
+            if summoner.id == summoner_id:
+                return summoner.name
 
     @classmethod
     @lru_cache()
@@ -52,9 +73,9 @@ class Summoner:
         summoner_id - id of summoner spell
         """
 
-        for summoner in cls.summoners["data"].values():
-            if summoner["key"] == summoner_id:
-                return summoner["id"]
+        for summoner in cls.summoners:
+            if summoner.id == summoner_id:
+                return summoner.alternate_name
 
     @classmethod
     @lru_cache()
@@ -66,9 +87,9 @@ class Summoner:
         alternate_name - alternate_name of summoner spell
         """
 
-        for summoner in cls.summoners["data"].values():
-            if summoner["id"] == alternate_name:
-                return summoner["key"]
+        for summoner in cls.summoners:
+            if summoner.alternate_name == alternate_name:
+                return summoner.id
 
     @classmethod
     @lru_cache()
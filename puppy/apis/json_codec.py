@@ -0,0 +1,47 @@
+import json
+from typing import Any, Union
+
+from requests.models import Response
+
+try:
+    import orjson
+except ImportError:  # optional, json is used if it is not installed
+    orjson = None
+
+
+# raised when decoding fails, orjson's decode error is a subclass of it
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parses json, using orjson if it is installed
+
+    data - json to parse, bytes are decoded directly without decoding to str first
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Serializes data to utf-8 encoded json, using orjson if it is installed
+
+    data - data to serialize
+    """
+
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode("utf-8")
+
+
+def response_json(r: Response) -> Any:
+    """
+    Parses the json body of a response from its bytes
+
+    r - requests response object
+    """
+
+    return loads(r.content)
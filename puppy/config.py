@@ -25,8 +25,30 @@ class Config:
                 print(f"Adding missing config field {k}")
                 self.config[k] = v
 
-        # convert fields in outdated config
+        self.convert(static_data=False)
+        self.validate(static_data=False)
+
+    def validate_static_data(self):
+        """
+        Converts and validates the fields that need static data
+        Called once the patch and source of static data are known,
+            so that static data is not loaded for the wrong patch
+        """
+
+        self.convert(static_data=True)
+        self.validate(static_data=True)
+
+    def convert(self, static_data: bool):
+        """
+        Converts fields in an outdated config and saves it
+
+        static_data - whether to convert the fields that need static data,
+            otherwise the other fields
+        """
+
         for k, v in self.config.items():
+            if CONFIG_STRUCTURE[k].get("static_data", False) != static_data:
+                continue
             if "should_convert" in CONFIG_STRUCTURE[k] and CONFIG_STRUCTURE[k][
                 "should_convert"
             ](v):
@@ -36,8 +58,17 @@ class Config:
         with open(CONFIG_FILENAME, "w") as f:
             json.dump(self.config, f, indent=4)
 
-        # validate
+    def validate(self, static_data: bool):
+        """
+        Validates fields
+
+        static_data - whether to validate the fields that need static data,
+            otherwise the other fields
+        """
+
         for k, v in self.config.items():
+            if CONFIG_STRUCTURE[k].get("static_data", False) != static_data:
+                continue
             expected_type = CONFIG_STRUCTURE[k]["type"]
             if not isinstance(v, expected_type):
                 raise ValueError(
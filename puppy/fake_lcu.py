@@ -0,0 +1,554 @@
+import argparse
+import base64
+import json
+import re
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from puppy.apis import Auth
+
+
+DEFAULT_KEY = "fake-lcu-key"  # auth token that the fake lcu accepts by default
+# default steps run by the fake lcu (see FakeLcu.run_script)
+DEFAULT_SCRIPT = [
+    {"delay": 0, "action": "set_phase", "phase": "Lobby"},
+    {"delay": 2, "action": "set_phase", "phase": "Matchmaking"},
+    {"delay": 2, "action": "start_champ_select", "assigned_position": "middle"},
+    {"delay": 3, "action": "lock_champion", "champion_id": 103},
+    {"delay": 30, "action": "end_champ_select", "phase": "InProgress"},
+]
+# state transitions that scripts can run
+SCRIPT_ACTIONS = [
+    "set_phase",
+    "start_champ_select",
+    "lock_champion",
+    "end_champ_select",
+    "set_game_version",
+]
+
+
+class FakeLcuState:
+    """
+    State of the fake lcu and the handlers for the endpoints puppy uses
+    State transitions are made with set_phase, start_champ_select, lock_champion,
+        end_champ_select, and set_game_version
+    """
+
+    def __init__(
+        self,
+        summoner_id: int = 1234,
+        map_name: str = "Summoner's Rift",
+        game_version: Optional[str] = None,
+    ):
+        """
+        summoner_id - id of the logged in summoner
+        map_name - lcu name of the map of the game (e.g. "Howling Abyss")
+        game_version - version of the client, None to not report one so that
+            puppy uses the latest ddragon patch
+        """
+
+        self.lock = threading.Lock()
+        self.summoner = {
+            "summonerId": summoner_id,
+            "accountId": summoner_id,
+            "displayName": "Puppy",
+        }
+        self.map_name = map_name
+        self.game_version = game_version
+        self.phase = "None"
+        self.session: Optional[Dict[str, Any]] = None
+        self.next_rune_page_id = 1
+        self.rune_pages: List[Dict[str, Any]] = []
+        self.current_rune_page_id: Optional[int] = None
+        self.item_sets: Dict[str, Dict[str, Any]] = {}
+        self.request_counts: Dict[str, int] = {}  # requests per method and route
+        self.add_rune_page({"name": "Custom", "isEditable": True})
+        self.add_rune_page({"name": "Default", "isEditable": False})
+
+        # (method, path regex, handler)
+        self.routes = [
+            ("GET", r"/lol-gameflow/v1/gameflow-phase", self.get_gameflow_phase),
+            ("GET", r"/lol-gameflow/v1/session", self.get_gameflow_session),
+            ("GET", r"/lol-champ-select/v1/session", self.get_session),
+            ("GET", r"/lol-champ-select/v1/current-champion", self.get_champion),
+            (
+                "PATCH",
+                r"/lol-champ-select/v1/session/my-selection",
+                self.patch_my_selection,
+            ),
+            ("GET", r"/lol-perks/v1/pages", self.get_rune_pages),
+            ("POST", r"/lol-perks/v1/pages", self.post_rune_page),
+            ("PUT", r"/lol-perks/v1/pages/(\d+)", self.put_rune_page),
+            ("DELETE", r"/lol-perks/v1/pages/(\d+)", self.delete_rune_page),
+            ("GET", r"/lol-perks/v1/currentpage", self.get_current_rune_page),
+            ("PUT", r"/lol-perks/v1/currentpage", self.put_current_rune_page),
+            ("GET", r"/lol-summoner/v1/current-summoner", self.get_summoner),
+            ("GET", r"/lol-item-sets/v1/item-sets/(\d+)/sets", self.get_item_sets),
+            ("PUT", r"/lol-item-sets/v1/item-sets/(\d+)/sets", self.put_item_sets),
+            ("GET", r"/lol-patch/v1/game-version", self.get_game_version),
+        ]
+
+    def handle(self, method: str, path: str, body: Any) -> Tuple[int, Any]:
+        """
+        Handles a request
+        Returns a tuple of the status code and the data to respond with
+
+        method - http method
+        path - path of the request
+        body - parsed json body of the request, None if there is none
+        """
+
+        for route_method, pattern, handler in self.routes:
+            match = re.fullmatch(pattern, path)
+            if route_method == method and match:
+                with self.lock:
+                    key = f"{method} {pattern}"
+                    self.request_counts[key] = self.request_counts.get(key, 0) + 1
+                    return handler(body, *match.groups())
+        return 404, {"errorCode": "RPC_ERROR", "message": "Invalid URI format"}
+
+    # state transitions
+
+    def set_phase(self, phase: str):
+        """
+        Sets the gameflow phase
+
+        phase - lcu name of the gameflow phase (e.g. "Lobby")
+        """
+
+        with self.lock:
+            self.phase = phase
+
+    def set_game_version(self, game_version: str):
+        """
+        Sets the version of the client
+
+        game_version - version of the client (e.g. "13.1.486.1234")
+        """
+
+        with self.lock:
+            self.game_version = game_version
+
+    def start_champ_select(self, assigned_position: str = ""):
+        """
+        Starts champ select with no champion locked in
+
+        assigned_position - lcu name of the assigned role, empty for none
+        """
+
+        with self.lock:
+            self.phase = "ChampSelect"
+            self.session = {
+                "localPlayerCellId": 0,
+                "myTeam": [
+                    {
+                        "cellId": 0,
+                        "summonerId": self.summoner["summonerId"],
+                        "assignedPosition": assigned_position,
+                        "championId": 0,
+                        "spell1Id": 4,
+                        "spell2Id": 14,
+                    }
+                ],
+                "actions": [
+                    [
+                        {
+                            "id": 1,
+                            "actorCellId": 0,
+                            "type": "pick",
+                            "championId": 0,
+                            "completed": False,
+                            "isInProgress": True,
+                        }
+                    ]
+                ],
+                "benchChampions": [],
+                "timer": {"phase": "BAN_PICK", "adjustedTimeLeftInPhase": 30000},
+            }
+
+    def lock_champion(self, champion_id: int):
+        """
+        Locks in a champion for the local player
+
+        champion_id - id of the champion to lock in
+        """
+
+        with self.lock:
+            assert self.session is not None, "not in champ select"
+            self.session["myTeam"][0]["championId"] = champion_id
+            for action in self.session["actions"][0]:
+                action.update(
+                    championId=champion_id, completed=True, isInProgress=False
+                )
+            self.session["timer"] = {
+                "phase": "FINALIZATION",
+                "adjustedTimeLeftInPhase": 30000,
+            }
+
+    def end_champ_select(self, phase: str = "InProgress"):
+        """
+        Ends champ select
+
+        phase - lcu name of the gameflow phase after champ select
+        """
+
+        with self.lock:
+            self.phase = phase
+            self.session = None
+
+    # endpoint handlers
+
+    def get_gameflow_phase(self, body: Any) -> Tuple[int, Any]:
+        return 200, self.phase
+
+    def get_gameflow_session(self, body: Any) -> Tuple[int, Any]:
+        return 200, {"phase": self.phase, "map": {"name": self.map_name}}
+
+    def get_session(self, body: Any) -> Tuple[int, Any]:
+        if self.session is None:
+            return 404, {"errorCode": "RPC_ERROR", "message": "No active delegate"}
+        return 200, self.session
+
+    def get_champion(self, body: Any) -> Tuple[int, Any]:
+        if self.session is None:
+            return 404, {"errorCode": "RPC_ERROR", "message": "No active delegate"}
+        return 200, self.session["myTeam"][0]["championId"]
+
+    def patch_my_selection(self, body: Any) -> Tuple[int, Any]:
+        if self.session is None:
+            return 404, {"errorCode": "RPC_ERROR", "message": "No active delegate"}
+        self.session["myTeam"][0].update(
+            {k: v for k, v in body.items() if k in ("spell1Id", "spell2Id")}
+        )
+        return 204, None
+
+    def get_rune_pages(self, body: Any) -> Tuple[int, Any]:
+        return 200, self.rune_pages
+
+    def post_rune_page(self, body: Any) -> Tuple[int, Any]:
+        return 200, self.add_rune_page(body)
+
+    def put_rune_page(self, body: Any, rune_page_id: str) -> Tuple[int, Any]:
+        rune_page = self.find_rune_page(int(rune_page_id))
+        if rune_page is None:
+            return 404, {"errorCode": "RPC_ERROR", "message": "Page not found"}
+        rune_page.update(body, id=rune_page["id"])
+        if body.get("current"):
+            self.current_rune_page_id = rune_page["id"]
+        return 201, rune_page
+
+    def delete_rune_page(self, body: Any, rune_page_id: str) -> Tuple[int, Any]:
+        rune_page = self.find_rune_page(int(rune_page_id))
+        if rune_page is None:
+            return 404, {"errorCode": "RPC_ERROR", "message": "Page not found"}
+        self.rune_pages.remove(rune_page)
+        if self.current_rune_page_id == rune_page["id"]:
+            self.current_rune_page_id = self.rune_pages[0]["id"]
+        return 204, None
+
+    def get_current_rune_page(self, body: Any) -> Tuple[int, Any]:
+        rune_page = self.find_rune_page(self.current_rune_page_id)
+        return 200, dict(rune_page, current=True, isActive=True)  # type: ignore
+
+    def put_current_rune_page(self, body: Any) -> Tuple[int, Any]:
+        if self.find_rune_page(int(body)) is None:
+            return 404, {"errorCode": "RPC_ERROR", "message": "Page not found"}
+        self.current_rune_page_id = int(body)
+        return 204, None
+
+    def get_summoner(self, body: Any) -> Tuple[int, Any]:
+        return 200, self.summoner
+
+    def get_item_sets(self, body: Any, summoner_id: str) -> Tuple[int, Any]:
+        return 200, self.item_sets.setdefault(
+            summoner_id,
+            {"accountId": int(summoner_id), "itemSets": [], "timestamp": 0},
+        )
+
+    def put_item_sets(self, body: Any, summoner_id: str) -> Tuple[int, Any]:
+        for i, item_set in enumerate(body["itemSets"]):
+            item_set.setdefault("uid", f"{summoner_id}-{time.time_ns()}-{i}")
+        self.item_sets[summoner_id] = dict(body, timestamp=time.time_ns() // 1000000)
+        return 201, None
+
+    def get_game_version(self, body: Any) -> Tuple[int, Any]:
+        if self.game_version is None:
+            return 404, {"errorCode": "RPC_ERROR", "message": "No game version"}
+        return 200, self.game_version
+
+    # helpers
+
+    def add_rune_page(self, rune_page: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Adds a rune page
+        Returns the added rune page
+
+        rune_page - rune page to add, its id is assigned by the fake lcu
+        """
+
+        rune_page = dict(
+            {"isDeletable": True, "isEditable": True, "selectedPerkIds": []},
+            **rune_page,
+            id=self.next_rune_page_id,
+        )
+        self.next_rune_page_id += 1
+        self.rune_pages.append(rune_page)
+        if rune_page.get("current") or self.current_rune_page_id is None:
+            self.current_rune_page_id = rune_page["id"]
+        return rune_page
+
+    def find_rune_page(self, rune_page_id: Optional[int]) -> Optional[Dict[str, Any]]:
+        """
+        Returns the rune page with an id
+        Returns None if there is no rune page with the id
+
+        rune_page_id - id of rune page to find
+        """
+
+        for rune_page in self.rune_pages:
+            if rune_page["id"] == rune_page_id:
+                return rune_page
+
+
+class FakeLcuRequestHandler(BaseHTTPRequestHandler):
+    """
+    Http request handler that checks auth and passes requests to the fake lcu state
+    """
+
+    protocol_version = "HTTP/1.1"  # keep connections alive like the real lcu
+    # headers and body are written separately, which nagle would delay by ~40ms
+    disable_nagle_algorithm = True
+
+    def handle_request(self):
+        body = None
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            body = json.loads(self.rfile.read(length))
+
+        key = self.server.key  # type: ignore
+        token = base64.b64encode(f"riot:{key}".encode()).decode()
+        if self.headers.get("Authorization") != f"Basic {token}":
+            self.respond(401, {"errorCode": "RPC_ERROR", "message": "Unauthorized"})
+            return
+
+        path = self.path.split("?", 1)[0].rstrip("/")
+        state = self.server.state  # type: ignore
+        self.respond(*state.handle(self.command, path, body))
+
+    def respond(self, status: int, data: Any):
+        """
+        Sends a json response
+
+        status - http status code
+        data - data to send as json, None for no body
+        """
+
+        contents = b"" if data is None else json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(contents)))
+        self.end_headers()
+        self.wfile.write(contents)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = handle_request
+
+    def log_message(self, format: str, *args: Any):
+        # requests are counted by the state instead of logged
+        pass
+
+
+class FakeLcuServer(ThreadingHTTPServer):
+    """
+    Https server of the fake lcu
+    """
+
+    daemon_threads = True
+
+    def handle_error(self, request: Any, client_address: Any):
+        # clients that time out drop their connection, which is expected
+        pass
+
+
+class FakeLcu:
+    """
+    Fake lcu api served over https on localhost
+    Lets puppy run without the League client (e.g. to test or benchmark on Linux)
+    """
+
+    def __init__(
+        self,
+        port: int = 0,
+        key: str = DEFAULT_KEY,
+        certfile: Optional[str] = None,
+        keyfile: Optional[str] = None,
+        state: Optional[FakeLcuState] = None,
+    ):
+        """
+        port - port to listen on, 0 for any free port
+        key - auth token to accept
+        certfile - path of certificate to serve, self signed one is made if not given
+        keyfile - path of private key of the certificate
+        state - initial state of the fake lcu
+        """
+
+        self.temp_directory = None
+        if certfile is None:
+            self.temp_directory = tempfile.mkdtemp(prefix="fake_lcu")
+            certfile, keyfile = make_self_signed_certificate(Path(self.temp_directory))
+
+        self.server = FakeLcuServer(("127.0.0.1", port), FakeLcuRequestHandler)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certfile, keyfile)
+        self.server.socket = context.wrap_socket(self.server.socket, server_side=True)
+        self.server.key = key  # type: ignore
+        self.server.state = state or FakeLcuState()  # type: ignore
+
+        self.key = key
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def state(self) -> FakeLcuState:
+        return self.server.state  # type: ignore
+
+    @property
+    def auth(self) -> Auth:
+        """
+        Auth for connecting puppy to the fake lcu
+        """
+
+        return Auth(port=str(self.port), key=self.key)
+
+    def start(self):
+        """
+        Starts serving in a background thread
+        """
+
+        self.thread.start()
+
+    def stop(self):
+        """
+        Stops serving and removes the generated certificate
+        """
+
+        self.server.shutdown()
+        self.server.server_close()
+        if self.temp_directory is not None:
+            shutil.rmtree(self.temp_directory, ignore_errors=True)
+
+    def run_script(self, steps: List[Dict[str, Any]]):
+        """
+        Runs state transitions in order, blocking until they are done
+        Each step is a dict with the seconds to wait before it ("delay"),
+            the name of a FakeLcuState transition ("action"),
+            and the arguments of the transition (e.g. {"phase": "Lobby"})
+
+        steps - steps to run
+        """
+
+        for step in steps:
+            arguments = dict(step)
+            time.sleep(arguments.pop("delay", 0))
+            action = arguments.pop("action")
+            if action not in SCRIPT_ACTIONS:
+                raise ValueError(
+                    f"Invalid fake lcu action: {action} "
+                    f"(must be one of {', '.join(SCRIPT_ACTIONS)})"
+                )
+            print(f"Fake LCU: {action} {arguments}")
+            getattr(self.state, action)(**arguments)
+
+
+def make_self_signed_certificate(directory: Path) -> Tuple[str, str]:
+    """
+    Makes a self signed certificate for localhost with openssl
+    Returns a tuple of the paths of the certificate and its private key
+
+    directory - directory to write the certificate and key to
+    """
+
+    certfile = str(directory / "cert.pem")
+    keyfile = str(directory / "key.pem")
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=127.0.0.1",
+            "-keyout",
+            keyfile,
+            "-out",
+            certfile,
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return certfile, keyfile
+
+
+def main():
+    """
+    Runs a fake lcu from the command line
+    """
+
+    parser = argparse.ArgumentParser(description="Fake League client api")
+    parser.add_argument("--port", type=int, default=0, help="port to listen on")
+    parser.add_argument("--key", default=DEFAULT_KEY, help="auth token to accept")
+    parser.add_argument("--cert", help="certificate to serve (self signed if absent)")
+    parser.add_argument("--cert-key", help="private key of the certificate")
+    parser.add_argument("--map", default="Summoner's Rift", help="lcu map name")
+    parser.add_argument(
+        "--game-version", help="client version to report (latest patch if absent)"
+    )
+    parser.add_argument(
+        "--script", help="json file of state transitions (see FakeLcu.run_script)"
+    )
+    args = parser.parse_args()
+
+    steps = DEFAULT_SCRIPT
+    if args.script:
+        with open(args.script, "r") as f:
+            steps = json.load(f)
+
+    fake_lcu = FakeLcu(
+        port=args.port,
+        key=args.key,
+        certfile=args.cert,
+        keyfile=args.cert_key,
+        state=FakeLcuState(map_name=args.map, game_version=args.game_version),
+    )
+    fake_lcu.start()
+    print(f"Fake LCU listening on https://127.0.0.1:{fake_lcu.port}/")
+    print("Run puppy against it with:")
+    print(
+        f"    PUPPY_LCU_PORT={fake_lcu.port} PUPPY_LCU_KEY={fake_lcu.key} "
+        "python -m puppy"
+    )
+    try:
+        fake_lcu.run_script(steps)
+        print("Script done, press Ctrl+C to exit")
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(fake_lcu.state.request_counts, indent=4))
+        fake_lcu.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+class ItemSetsMirror:
+    """
+    Local copy of the item sets document in the League client
+    Each item set is hashed so that unchanged documents can be detected
+        without writing them
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.document: Optional[Dict[str, Any]] = None
+        self.hashes: Optional[Tuple[str, ...]] = None
+
+    def get(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns a copy of the mirrored item sets document
+        Returns None if the mirror is out of date and must be fetched again
+        """
+
+        with self.lock:
+            if self.document is None:
+                return None
+            return dict(self.document, itemSets=list(self.document["itemSets"]))
+
+    def set(self, document: Dict[str, Any]):
+        """
+        Sets the mirrored document to one that is known to be in the client
+
+        document - item sets document
+        """
+
+        hashes = self.hash_document(document)
+        with self.lock:
+            self.document = document
+            self.hashes = hashes
+
+    def invalidate(self):
+        """
+        Marks the mirror as out of date
+        """
+
+        with self.lock:
+            self.document = None
+            self.hashes = None
+
+    def is_unchanged(self, document: Dict[str, Any]) -> bool:
+        """
+        Returns whether a document has the same item sets as the client
+
+        document - item sets document
+        """
+
+        hashes = self.hash_document(document)
+        with self.lock:
+            return self.hashes is not None and self.hashes == hashes
+
+    def on_event(self, document: Optional[Dict[str, Any]]):
+        """
+        Invalidates the mirror if the client's item sets were edited elsewhere
+        Writes made through the mirror do not invalidate it
+
+        document - item sets document pushed by the client
+        """
+
+        if document is None or not self.is_unchanged(document):
+            self.invalidate()
+
+    @classmethod
+    def hash_document(cls, document: Dict[str, Any]) -> Tuple[str, ...]:
+        """
+        Returns the hashes of every item set in a document, in order
+
+        document - item sets document
+        """
+
+        return tuple(cls.hash_item_set(item_set) for item_set in document["itemSets"])
+
+    @staticmethod
+    def hash_item_set(item_set: Dict[str, Any]) -> str:
+        """
+        Returns a hash of the contents of an item set
+        Fields that the client fills in itself (e.g. uid) are ignored
+
+        item_set - item set in the format used by the client
+        """
+
+        contents = {
+            "title": item_set.get("title"),
+            "associatedChampions": item_set.get("associatedChampions"),
+            "associatedMaps": item_set.get("associatedMaps"),
+            "map": item_set.get("map"),
+            "mode": item_set.get("mode"),
+            "type": item_set.get("type"),
+            "sortrank": item_set.get("sortrank"),
+            "preferredItemSlots": item_set.get("preferredItemSlots"),
+            "blocks": [
+                (
+                    block.get("type"),
+                    [(item.get("id"), item.get("count")) for item in block["items"]],
+                )
+                for block in item_set.get("blocks", [])
+            ],
+        }
+        return hashlib.sha1(
+            json.dumps(contents, sort_keys=True).encode("utf-8")
+        ).hexdigest()
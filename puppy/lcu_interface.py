@@ -1,9 +1,40 @@
+import asyncio
 from time import sleep
-from typing import Dict, Tuple, Optional, Any
-
-from puppy.apis import Lcu
-from puppy.static import QUEUES, GAMEFLOW_PHASE, SUMMONERS_RIFT
-from puppy.models import Queue, Role
+from typing import Awaitable, Dict, List, Tuple, Optional, Any
+
+from requests.exceptions import RequestException
+
+from puppy.apis import Lcu, AsyncLcu, LcuEvents
+from puppy.apis.client.exceptions import LeagueProcessNotFoundError
+from puppy.apis.json_codec import response_json
+from puppy.static import (
+    QUEUES,
+    GAMEFLOW_PHASE,
+    SUMMONERS_RIFT,
+    ALL_ROLES,
+    EVENT_POLL_TIME,
+)
+from puppy.models import Queue, Role, ChampSelectSnapshot
+from puppy.poll_scheduler import PollScheduler
+from puppy.item_sets_mirror import ItemSetsMirror
+
+# endpoints whose data is pushed by the lcu instead of polled
+EVENT_ENDPOINTS = [
+    ["lol-gameflow", "v1", "gameflow-phase"],
+    ["lol-champ-select", "v1", "session"],
+    ["lol-perks", "v1", "currentpage"],
+    ["lol-summoner", "v1", "current-summoner"],
+]
+# rune page fields that are compared to decide whether a page needs updating
+RUNE_PAGE_FIELDS = ("name", "primaryStyleId", "subStyleId", "selectedPerkIds")
+# errors that are retried with backoff while waiting for champ select or lock in
+POLL_ERRORS = (
+    RequestException,
+    LeagueProcessNotFoundError,
+    ValueError,
+    KeyError,
+    TypeError,
+)
 
 
 class LcuInterface:
@@ -11,8 +42,85 @@ class LcuInterface:
     High level interface to lcu api
     """
 
-    def __init__(self):
-        self.lcu = Lcu()
+    def __init__(self, poll_times: Dict[str, float], lcu: Optional[Lcu] = None):
+        """
+        poll_times - times between polls for the poll scheduler (seconds)
+        lcu - lcu api connector, connects to the running client if not given
+        """
+
+        self.lcu = lcu or Lcu()
+        self.scheduler = PollScheduler(**poll_times)
+        self.counted_requests = 0
+        self.async_lcu = AsyncLcu(self.lcu)
+        self.events = LcuEvents(
+            self.lcu, [self.make_uri(endpoint) for endpoint in EVENT_ENDPOINTS]
+        )
+        self.item_sets_mirror = ItemSetsMirror()
+        self.events.add_connection_listener(self.on_connection_changed)
+        self.events.add_listener(
+            self.make_uri(["lol-summoner", "v1", "current-summoner"]),
+            self.on_summoner_changed,
+        )
+        self.events.start()
+        self.seen_event_version = 0
+
+    def on_connection_changed(self, connected: bool):
+        """
+        Clears cached data that may have changed while disconnected
+
+        connected - whether the connection to lcu events is open
+        """
+
+        self.lcu.set_summoner_id(None)
+        self.item_sets_mirror.invalidate()
+
+    def on_summoner_changed(self, summoner: Optional[Dict[str, Any]]):
+        """
+        Clears cached data for the previous summoner
+
+        summoner - current summoner data pushed by the lcu
+        """
+
+        self.lcu.set_summoner_id(summoner["summonerId"] if summoner else None)
+        self.item_sets_mirror.invalidate()
+
+    def get_json(self, endpoint: List[str]) -> Any:
+        """
+        Gets the parsed json data of an endpoint
+        Uses data pushed by the lcu if it is available, otherwise polls the endpoint
+        Returns None if the endpoint does not exist
+
+        endpoint - iterable that is joined to form the endpoint path
+        """
+
+        uri = self.make_uri(endpoint)
+        found, data = self.events.get(uri)
+        if found:
+            return data
+
+        version = self.events.version
+        r = self.lcu.get(endpoint)
+        data = None if r.status_code == 404 else response_json(r)
+        self.events.seed(uri, data, version)
+        return data
+
+    def wait(self):
+        """
+        Blocks until the lcu pushes new data
+        Sleeps for the scheduled poll time instead if pushed data is unavailable
+            or the last poll failed
+        """
+
+        request_count = self.lcu.request_count
+        self.scheduler.record_requests(request_count - self.counted_requests)
+        self.counted_requests = request_count
+
+        if self.events.connected and not self.scheduler.errors:
+            self.seen_event_version = self.events.wait(
+                self.seen_event_version, EVENT_POLL_TIME
+            )
+        else:
+            sleep(self.scheduler.get_poll_time())
 
     def get_gameflow_phase(self) -> GAMEFLOW_PHASE:
         """
@@ -20,76 +128,114 @@ class LcuInterface:
         Returns a GAMEFLOW_PHASE enum
         """
 
-        return GAMEFLOW_PHASE(
-            self.lcu.get(["lol-gameflow", "v1", "gameflow-phase"]).text.strip('"')
+        phase = GAMEFLOW_PHASE(
+            self.get_json(["lol-gameflow", "v1", "gameflow-phase"]) or "None"
         )
+        self.scheduler.set_phase(phase)
+        return phase
 
     def get_current_queue(self) -> Queue:
         """
         Returns the current queue (from QUEUES QueueList)
         """
 
-        queue = QUEUES.get_queue_by_lcu_queue_name(
-            self.lcu.get(["lol-gameflow", "v1", "session"]).json()["map"]["name"]
-        )
+        r = self.lcu.get(["lol-gameflow", "v1", "session"])
+        queue = QUEUES.get_queue_by_lcu_queue_name(response_json(r)["map"]["name"])
         if not queue:
             queue = QUEUES.get_default()
         return queue
 
-    def wait_for_champ_select(self, sleep_time):
+    def wait_for_champ_select(self):
         """
         Blocks until champ select
-
-        sleep_time - time to sleep between polls (seconds)
         """
 
         while True:
-            if self.get_gameflow_phase() == GAMEFLOW_PHASE.CHAMP_SELECT:
-                break
+            try:
+                phase = self.get_gameflow_phase()
+            except POLL_ERRORS as e:
+                self.record_poll_error(e)
             else:
-                sleep(sleep_time)
+                self.scheduler.record_success()
+                if phase == GAMEFLOW_PHASE.CHAMP_SELECT:
+                    break
+            self.wait()
 
-    def wait_for_champion_lock(self, sleep_time):
+    def wait_for_champion_lock(self):
         """
-        Blocks until champion lock in
-
-        sleep_time - time to sleep between polls (seconds)
+        Blocks until champion lock in or champ select ends
         """
 
         while True:
-            r = self.lcu.get(["lol-champ-select", "v1", "current-champion"])
-            if r.status_code != "404" and r.text != "0":
-                return
+            try:
+                snapshot = self.get_champ_select_snapshot()
+            except POLL_ERRORS as e:
+                self.record_poll_error(e)
             else:
-                sleep(sleep_time)
+                self.scheduler.record_success()
+                if snapshot is None or snapshot.champion_id:
+                    return
+            self.wait()
+
+    def record_poll_error(self, error: Exception):
+        """
+        Records a failed poll so that the next poll is backed off
+
+        error - error raised by the poll
+        """
+
+        self.scheduler.record_error()
+        print(
+            f"Unable to poll League client ({error}), "
+            f"retrying in {self.scheduler.get_poll_time():g}s"
+        )
+
+    def get_champ_select_snapshot(self) -> Optional[ChampSelectSnapshot]:
+        """
+        Gets the current state of champ select in one request
+        Returns None if not in champ select
+        """
+
+        session = self.get_json(["lol-champ-select", "v1", "session"])
+        if session is None:
+            return None
+        self.scheduler.set_phase(GAMEFLOW_PHASE.CHAMP_SELECT)
+        return ChampSelectSnapshot(session)
 
     def get_current_champion(self) -> str:
         """
-        Gets the id of the currently selected champion
-        Returns the champion id as str
+        Gets the id of the currently locked in champion
+        Returns the champion id as str, "0" if there is none
         """
 
-        return self.lcu.get(["lol-champ-select", "v1", "current-champion"]).text
+        snapshot = self.get_champ_select_snapshot()
+        return str(snapshot.champion_id if snapshot else 0)
 
-    def get_assigned_role(self) -> Optional[Role]:
+    def get_assigned_role(
+        self, snapshot: Optional[ChampSelectSnapshot] = None
+    ) -> Optional[Role]:
         """
         Returns assigned role of type Role
         Returns None if there is no assigned role
+
+        snapshot - champ select snapshot to read the role from, fetched if not given
         """
 
-        my_team = self.lcu.get(["lol-champ-select", "v1", "session"]).json()["myTeam"]
-        for team_member in my_team:
-            if team_member["summonerId"] == self.lcu.get_summoner_id():
-                lcu_role_name = team_member["assignedPosition"]
-                # can just search through sr roles because only sr has assigned roles
-                return SUMMONERS_RIFT.roles.get_role_by_lcu_role_name(lcu_role_name) # type: ignore
+        if snapshot is None:
+            snapshot = self.get_champ_select_snapshot()
+        if snapshot is None:
+            return None
+        # can just search through sr roles because only sr has assigned roles
+        return SUMMONERS_RIFT.roles.get_role_by_lcu_role_name(
+            snapshot.assigned_position
+        )
 
     def get_current_rune_page(self) -> Dict[str, Any]:
         """
         Returns dict of current rune page
         """
 
-        return self.lcu.get(["lol-perks", "v1", "currentpage"]).json()
+        return self.get_json(["lol-perks", "v1", "currentpage"])
 
     def set_current_rune_page(self, rune_page_id: str):
         """
@@ -99,13 +245,14 @@ class LcuInterface:
         """
 
         r = self.lcu.put(["lol-perks", "v1", "currentpage"], data=rune_page_id)
+        self.invalidate_current_rune_page()
 
     def get_rune_pages(self) -> Dict[str, Any]:
         """
         Returns dict of all rune pages
         """
 
-        return self.lcu.get(["lol-perks", "v1", "pages"]).json()
+        return response_json(self.lcu.get(["lol-perks", "v1", "pages"]))
 
     def delete_rune_page(self, rune_page_id: str):
         """
@@ -115,15 +262,124 @@ class LcuInterface:
         """
 
         r = self.lcu.delete(["lol-perks", "v1", "pages", rune_page_id])
+        self.invalidate_current_rune_page()
 
-    def post_rune_page(self, rune_page: dict):
+    async def delete_rune_pages_async(self, rune_page_ids: List[str]):
+        """
+        Deletes rune pages concurrently given their ids
+
+        rune_page_ids - ids of rune pages to delete
+        """
+
+        await asyncio.gather(
+            *(
+                self.async_lcu.delete(["lol-perks", "v1", "pages", rune_page_id])
+                for rune_page_id in rune_page_ids
+            )
+        )
+        self.invalidate_current_rune_page()
+
+    def post_rune_page(self, rune_page: dict) -> Dict[str, Any]:
         """
         Posts a rune_page
+        Returns dict of the created rune page
 
         rune_page - built rune page
         """
 
         r = self.lcu.post(["lol-perks", "v1", "pages"], data=rune_page)
+        self.invalidate_current_rune_page()
+        return response_json(r)
+
+    def put_rune_page(self, rune_page_id: int, rune_page: dict):
+        """
+        Puts and overwrites a rune page given its id
+
+        rune_page_id - id of rune page to overwrite
+        rune_page - built rune page
+        """
+
+        r = self.lcu.put(
+            ["lol-perks", "v1", "pages", str(rune_page_id)],
+            data=dict(rune_page, id=rune_page_id),
+        )
+        self.invalidate_current_rune_page()
+
+    def invalidate_current_rune_page(self):
+        """
+        Forgets the pushed current rune page after changing rune pages,
+            so that it is not read stale before the lcu pushes the change
+        """
+
+        self.events.invalidate(self.make_uri(["lol-perks", "v1", "currentpage"]))
+
+    def sync_rune_pages(self, rune_pages: List[Dict[str, Any]]):
+        """
+        Makes the rune pages for roles match the given built rune pages
+        Existing pages for roles are updated in place, unchanged pages are skipped,
+            pages are only created when there are not enough existing ones,
+            and leftover pages are deleted
+        The page marked as active is set as the current page
+
+        rune_pages - built rune pages
+        """
+
+        unmatched = [
+            page for page in self.get_rune_pages() if self.is_role_rune_page(page)
+        ]
+        # reuse the page with the same name, otherwise any other page for a role
+        matches = []
+        for rune_page in rune_pages:
+            match = next(
+                (page for page in unmatched if page["name"] == rune_page["name"]), None
+            )
+            if match is not None:
+                unmatched.remove(match)
+            matches.append(match)
+        matches = [
+            match if match is not None or not unmatched else unmatched.pop(0)
+            for match in matches
+        ]
+
+        # delete leftover pages first to make room for new ones
+        if unmatched:
+            self.run_concurrently(
+                self.delete_rune_pages_async([str(page["id"]) for page in unmatched])
+            )
+
+        active_rune_page_id = None
+        for rune_page, match in zip(rune_pages, matches):
+            # the current page is set once at the end
+            new_rune_page = dict(rune_page, current=False)
+            if match is None:
+                rune_page_id = self.post_rune_page(new_rune_page)["id"]
+            else:
+                rune_page_id = match["id"]
+                changed = any(
+                    match.get(field) != rune_page[field] for field in RUNE_PAGE_FIELDS
+                )
+                if changed:
+                    self.put_rune_page(rune_page_id, new_rune_page)
+            if rune_page["isActive"]:
+                active_rune_page_id = rune_page_id
+
+        if active_rune_page_id is not None:
+            current_rune_page = self.get_current_rune_page()
+            if not current_rune_page or current_rune_page["id"] != active_rune_page_id:
+                self.set_current_rune_page(str(active_rune_page_id))
+
+    @staticmethod
+    def is_role_rune_page(rune_page: Dict[str, Any]) -> bool:
+        """
+        Returns whether a rune page is an editable page for a role
+            (i.e. one that is managed by puppy)
+
+        rune_page - dict of rune page
+        """
+
+        return rune_page["isEditable"] and any(
+            role.display_role_name in rune_page["name"] for role in ALL_ROLES
+        )
 
     # def get_owned_rune_page_count(self) -> int:
     #     """
@@ -144,35 +400,123 @@ class LcuInterface:
             data={"spell1Id": summoners[0], "spell2Id": summoners[1]},
         )
 
+    async def edit_summoners_async(self, summoners: Tuple[int, int]):
+        """
+        Patches new summoners without blocking
+
+        summoners - tuple of summoners ids
+        """
+
+        r = await self.async_lcu.patch(
+            ["lol-champ-select", "v1", "session", "my-selection"],
+            data={"spell1Id": summoners[0], "spell2Id": summoners[1]},
+        )
+
+    def get_item_sets_endpoint(self, summoner_id: int) -> List[str]:
+        """
+        Returns the item sets endpoint for a summoner
+        Subscribes to its events so that edits made elsewhere are detected
+
+        summoner_id - id of summoner whose item sets are used
+        """
+
+        endpoint = ["lol-item-sets", "v1", "item-sets", str(summoner_id), "sets"]
+        uri = self.make_uri(endpoint)
+        if uri not in self.events.uris:
+            self.events.add_listener(uri, self.item_sets_mirror.on_event)
+            self.events.subscribe(uri)
+        return endpoint
+
     def get_item_sets_data(self) -> Dict[str, Any]:
         """
         Returns all item set data
+        Uses the local mirror unless it may be out of date
+        """
+
+        item_sets_data = self.get_mirrored_item_sets_data()
+        if item_sets_data is not None:
+            return item_sets_data
+
+        endpoint = self.get_item_sets_endpoint(self.lcu.get_summoner_id())
+        item_sets_data = response_json(self.lcu.get(endpoint))
+        self.item_sets_mirror.set(item_sets_data)
+        return self.item_sets_mirror.get()  # type: ignore
+
+    async def get_item_sets_data_async(self) -> Dict[str, Any]:
+        """
+        Returns all item set data without blocking
+        Uses the local mirror unless it may be out of date
         """
 
-        return self.lcu.get(
-            [
-                "lol-item-sets",
-                "v1",
-                "item-sets",
-                str(self.lcu.get_summoner_id()),
-                "sets",
-            ]
-        ).json()
+        item_sets_data = self.get_mirrored_item_sets_data()
+        if item_sets_data is not None:
+            return item_sets_data
 
-    def put_item_sets_data(self, item_sets_data: dict):
+        summoner_id = await self.async_lcu.get_summoner_id()
+        r = await self.async_lcu.get(self.get_item_sets_endpoint(summoner_id))
+        self.item_sets_mirror.set(response_json(r))
+        return self.item_sets_mirror.get()  # type: ignore
+
+    def get_mirrored_item_sets_data(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the mirrored item set data
+        Returns None if edits made elsewhere could not have been detected
+        """
+
+        if not self.events.connected:
+            return None
+        return self.item_sets_mirror.get()
+
+    def put_item_sets_data(self, item_sets_data: dict) -> bool:
         """
         Puts and overwrites all item set data
+        Skipped if the item sets are the same as the ones in the client
+        Returns whether the item sets were put
 
         item_sets_data - item sets data to put
         """
 
+        if self.item_sets_mirror.is_unchanged(item_sets_data):
+            return False
+
         r = self.lcu.put(
-            [
-                "lol-item-sets",
-                "v1",
-                "item-sets",
-                str(self.lcu.get_summoner_id()),
-                "sets",
-            ],
+            self.get_item_sets_endpoint(self.lcu.get_summoner_id()),
             data=item_sets_data,
         )
+        if r.ok:
+            self.item_sets_mirror.set(item_sets_data)
+        else:
+            self.item_sets_mirror.invalidate()
+        return True
+
+    def print_summoner_id_stats(self):
+        """
+        Prints how many summoner id requests were saved by caching and resets the counts
+        """
+
+        requests = self.lcu.summoner_id_requests
+        hits = self.lcu.summoner_id_cache_hits
+        print(f"Summoner id requested {requests} times, {hits} requests saved by cache")
+        self.lcu.reset_summoner_id_counters()
+
+    @staticmethod
+    def run_concurrently(*awaitables: Awaitable) -> List[Any]:
+        """
+        Runs awaitables concurrently and blocks until they are all done
+        Returns their results in order
+        """
+
+        async def gather():
+            return await asyncio.gather(*awaitables)
+
+        return asyncio.run(gather())
+
+    @staticmethod
+    def make_uri(endpoint: List[str]) -> str:
+        """
+        Constructs an endpoint path from an endpoint iterable
+
+        endpoint - iterable that is joined to form the endpoint path
+        """
+
+        return "/" + "/".join(endpoint)
@@ -3,3 +3,4 @@ from puppy.models.role import Role, RoleList
 from puppy.models.rune import RuneList # , Shard, ShardList
 from puppy.models.ability import Ability, AbilityList
 from puppy.models.item import ItemBlock, ItemSet
+from puppy.models.champ_select import ChampSelectSnapshot
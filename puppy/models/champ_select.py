@@ -0,0 +1,73 @@
+from typing import Any, Dict, List, Optional
+
+
+class ChampSelectSnapshot:
+    """
+    Represents the state of champ select for the local player at one point in time
+    Parsed from a single lol-champ-select session
+    """
+
+    def __init__(self, session: Dict[str, Any]):
+        """
+        session - parsed json of lol-champ-select/v1/session
+        """
+
+        self.local_cell_id: int = session["localPlayerCellId"]
+
+        local_member = {}
+        for team_member in session.get("myTeam", []):
+            if team_member["cellId"] == self.local_cell_id:
+                local_member = team_member
+                break
+        self.summoner_id: Optional[int] = local_member.get("summonerId")
+        # lcu role name, empty if there is no assigned role
+        self.assigned_position: str = local_member.get("assignedPosition", "")
+
+        self.champion_id = self.get_locked_champion_id(session, local_member)
+
+        if "benchChampions" in session:
+            self.bench_champion_ids: List[int] = [
+                champion["championId"] for champion in session["benchChampions"]
+            ]
+        else:
+            self.bench_champion_ids = list(session.get("benchChampionIds", []))
+
+        timer = session.get("timer", {})
+        self.timer_phase: str = timer.get("phase", "")
+        # seconds left in the current timer phase
+        self.time_left: float = timer.get("adjustedTimeLeftInPhase", 0) / 1000
+
+    def get_locked_champion_id(
+        self, session: Dict[str, Any], local_member: Dict[str, Any]
+    ) -> int:
+        """
+        Returns the id of the champion locked in by the local player
+        Returns 0 if no champion is locked in
+
+        session - parsed json of lol-champ-select/v1/session
+        local_member - entry of the local player in the session's team
+        """
+
+        # pick actions only tell whether the champion is locked in,
+        # the team entry follows trades made after locking in
+        picked = False
+        for action_group in session.get("actions", []):
+            for action in action_group:
+                if action["type"] != "pick":
+                    continue
+                if action["actorCellId"] != self.local_cell_id:
+                    continue
+                picked = True
+                if action["completed"]:
+                    return local_member.get("championId", 0)
+        if picked:
+            return 0
+        # queues without pick actions (e.g. aram) assign champions directly
+        return local_member.get("championId", 0)
+
+    def __repr__(self) -> str:
+        return (
+            f"ChampSelectSnapshot(champion_id={self.champion_id}, "
+            f"assigned_position={self.assigned_position!r}, "
+            f"time_left={self.time_left:.1f})"
+        )
@@ -0,0 +1,90 @@
+from typing import Dict
+
+from puppy.static import GAMEFLOW_PHASE, IDLE_GAMEFLOW_PHASES
+
+
+class PollScheduler:
+    """
+    Decides how long to wait between polls of the lcu based on the gameflow phase
+    Polls slowly while idle, quickly during champ select,
+        and backs off exponentially after errors
+    Counts the requests made in each phase
+    """
+
+    def __init__(
+        self, idle: float, champ_select: float, other: float, max_backoff: float
+    ):
+        """
+        idle - time between polls while idle (e.g. in the lobby) (seconds)
+        champ_select - time between polls during champ select (seconds)
+        other - time between polls in all other phases (seconds)
+        max_backoff - maximum time between polls after errors (seconds)
+        """
+
+        self.idle = idle
+        self.champ_select = champ_select
+        self.other = other
+        self.max_backoff = max_backoff
+
+        self.phase = GAMEFLOW_PHASE.NONE
+        self.errors = 0  # number of consecutive errors
+        self.request_counts: Dict[GAMEFLOW_PHASE, int] = {}
+
+    def get_poll_time(self) -> float:
+        """
+        Returns the time to wait before the next poll (seconds)
+        """
+
+        if self.phase in IDLE_GAMEFLOW_PHASES:
+            poll_time = self.idle
+        elif self.phase == GAMEFLOW_PHASE.CHAMP_SELECT:
+            poll_time = self.champ_select
+        else:
+            poll_time = self.other
+
+        if self.errors:
+            # never back off to less than the normal poll time
+            return max(poll_time, min(poll_time * 2 ** self.errors, self.max_backoff))
+        return poll_time
+
+    def set_phase(self, phase: GAMEFLOW_PHASE):
+        """
+        Sets the current gameflow phase
+
+        phase - gameflow phase that was last seen
+        """
+
+        self.phase = phase
+
+    def record_requests(self, count: int):
+        """
+        Adds to the count of requests made in the current phase
+
+        count - number of requests made
+        """
+
+        self.request_counts[self.phase] = self.request_counts.get(self.phase, 0) + count
+
+    def record_error(self):
+        """
+        Records a failed poll, increasing the time until the next poll
+        """
+
+        self.errors += 1
+
+    def record_success(self):
+        """
+        Records a successful poll, resetting the time until the next poll
+        """
+
+        self.errors = 0
+
+    def print_stats(self):
+        """
+        Prints the number of requests made in each phase and resets the counts
+        """
+
+        print("Requests per gameflow phase:")
+        for phase, count in self.request_counts.items():
+            print(f"    {phase.value}: {count}")
+        self.request_counts.clear()
@@ -198,9 +198,18 @@ class GAMEFLOW_PHASE(Enum):
     WAITING_FOR_STATS = "WaitingForStats"
 
 
+# phases where nothing needs to be done soon
+IDLE_GAMEFLOW_PHASES = (
+    GAMEFLOW_PHASE.NONE,
+    GAMEFLOW_PHASE.LOBBY,
+    GAMEFLOW_PHASE.MATCHMAKING,
+)
+
+
 UAS = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/75.0.3770.142 Safari/537.36"  # user agent string
-SLEEP_TIME = 0.5  # time to sleep between polls
+EVENT_POLL_TIME = 5  # time to wait for pushed lcu data before polling again
 MIN_ACCEPTABLE_PATCH_MATCH_RATIO = 0.3  # ratio of games on current patch to previous patch required to use current patch's data
+ENOUGH_PATCH_MATCHES = 20000  # matches on current patch above which previous patch's data is not considered
 FLASH = 4  # id for flash summoner
 CONFIG_FILENAME = "config.json"  # name of config file
 DEFAULT_CONFIG = {  # default config file contents
@@ -211,6 +220,8 @@ DEFAULT_CONFIG = {  # default config file contents
     "backend": "ugg",
 }
 BACKENDS = ["ugg", "mobalytics"]  # data source
+STATIC_DATA_SOURCES = ["ddragon", "lcu"]  # static data source
+POLL_TIMES = ["idle", "champ_select", "other", "max_backoff"]  # poll time settings
 
 
 def convert_preferred_item_slots(item_slots: Dict[str, int]) -> Dict[str, int]:
@@ -253,6 +264,33 @@ def validate_backend(backend: str):
         )
 
 
+def validate_static_data_source(static_data_source: str):
+    if static_data_source not in STATIC_DATA_SOURCES:
+        raise ValueError(
+            f"Invalid value for config field static_data_source: {static_data_source} "
+            f"(must be one of {', '.join(STATIC_DATA_SOURCES)})"
+        )
+
+
+def validate_poll_times(poll_times: Dict[str, float]):
+    if sorted(poll_times) != sorted(POLL_TIMES):
+        raise ValueError(
+            f"Invalid keys for config field poll_times: {', '.join(poll_times)} "
+            f"(must be {', '.join(POLL_TIMES)})"
+        )
+    for name, poll_time in poll_times.items():
+        if isinstance(poll_time, bool) or not isinstance(poll_time, (int, float)):
+            raise ValueError(
+                f"Invalid value for poll_times field {name}: {poll_time} "
+                "(must be a number)"
+            )
+        if poll_time <= 0:
+            raise ValueError(
+                f"Invalid value for poll_times field {name}: {poll_time} "
+                "(must be positive)"
+            )
+
+
 CONFIG_STRUCTURE = {
     "flash_on_f": {
         "type": bool,
@@ -268,6 +306,7 @@ CONFIG_STRUCTURE = {
         ),
         "converter": convert_preferred_item_slots,
         "validator": validate_preferred_item_slots,
+        "static_data": True,  # converted and validated once the patch is known
     },
     "small_items": {
         "type": list,
@@ -276,6 +315,7 @@ CONFIG_STRUCTURE = {
         and all(isinstance(item, int) for item in items),
         "converter": convert_small_items,
         "validator": validate_small_items,
+        "static_data": True,
     },
     "backend": {
         "type": str,
@@ -283,4 +323,17 @@ CONFIG_STRUCTURE = {
         "validator": validate_backend,
     },
     "debug": {"type": bool, "default": False},
+    "patches_ttl": {"type": int, "default": 600},
+    "patch_from_client": {"type": bool, "default": True},
+    "static_data_source": {
+        "type": str,
+        "default": "ddragon",
+        "validator": validate_static_data_source,
+    },
+    "poll_times": {
+        "type": dict,
+        "default": {"idle": 2, "champ_select": 0.25, "other": 1, "max_backoff": 30},
+        "validator": validate_poll_times,
+    },
+    "item_sets_for_all_roles": {"type": bool, "default": False},
 }
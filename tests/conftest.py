@@ -0,0 +1,60 @@
+import pytest
+
+# short poll times so that waits end quickly
+POLL_TIMES = {"idle": 0.01, "champ_select": 0.01, "other": 0.01, "max_backoff": 0.05}
+
+
+@pytest.fixture
+def fake_lcu(tmp_path, monkeypatch):
+    """
+    Fake lcu served on a free port, stopped after the test
+    """
+
+    # importing puppy creates a config file in the working directory
+    monkeypatch.chdir(tmp_path)
+    from puppy.fake_lcu import FakeLcu
+
+    fake_lcu = FakeLcu()
+    fake_lcu.start()
+    yield fake_lcu
+    fake_lcu.stop()
+
+
+@pytest.fixture
+def lcu(fake_lcu):
+    """
+    Lcu connected to the fake lcu, with its own metrics
+    """
+
+    from puppy.apis import Lcu, LcuMetrics
+
+    lcu = Lcu(fake_lcu.auth, LcuMetrics())
+    yield lcu
+    lcu.session.close()
+
+
+@pytest.fixture
+def lcu_interface(lcu, monkeypatch):
+    """
+    Lcu interface connected to the fake lcu
+    The fake lcu has no WebSocket, so events are not listened for
+        and every read is a request
+    """
+
+    from puppy.apis import LcuEvents
+    from puppy.lcu_interface import LcuInterface
+
+    monkeypatch.setattr(LcuEvents, "start", lambda self: None)
+    return LcuInterface(POLL_TIMES, lcu)
+
+
+def request_count(fake_lcu, method: str, path: str) -> int:
+    """
+    Returns the number of requests the fake lcu handled for a route
+
+    fake_lcu - fake lcu that handled the requests
+    method - http method
+    path - path regex of the route (e.g. r"/lol-perks/v1/pages/(\\d+)")
+    """
+
+    return fake_lcu.state.request_counts.get(f"{method} {path}", 0)
@@ -0,0 +1,66 @@
+def make_session(champion_id: int, completed: bool, pick_champion_id=None) -> dict:
+    """
+    Returns a champ select session with one pick action for the local player
+
+    champion_id - champion of the local player's team entry
+    completed - whether the pick action is completed
+    pick_champion_id - champion of the pick action, champion_id if not given
+    """
+
+    return {
+        "localPlayerCellId": 2,
+        "myTeam": [
+            {"cellId": 1, "championId": 7, "assignedPosition": "top"},
+            {"cellId": 2, "championId": champion_id, "assignedPosition": "middle"},
+        ],
+        "actions": [
+            [
+                {
+                    "actorCellId": 1,
+                    "type": "pick",
+                    "championId": 7,
+                    "completed": True,
+                },
+                {
+                    "actorCellId": 2,
+                    "type": "pick",
+                    "championId": pick_champion_id or champion_id,
+                    "completed": completed,
+                },
+            ]
+        ],
+        "timer": {"phase": "BAN_PICK", "adjustedTimeLeftInPhase": 12500},
+    }
+
+
+def test_hovered_champion_is_not_locked_in(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    from puppy.models import ChampSelectSnapshot
+
+    snapshot = ChampSelectSnapshot(make_session(103, completed=False))
+
+    assert snapshot.champion_id == 0
+    assert snapshot.assigned_position == "middle"
+    assert snapshot.time_left == 12.5
+
+
+def test_locked_champion_follows_trades(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    from puppy.models import ChampSelectSnapshot
+
+    session = make_session(7, completed=True, pick_champion_id=103)
+
+    assert ChampSelectSnapshot(session).champion_id == 7
+
+
+def test_champion_without_pick_actions(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    from puppy.models import ChampSelectSnapshot
+
+    # e.g. aram, where champions are assigned
+    session = dict(make_session(103, completed=False), actions=[])
+    session["benchChampions"] = [{"championId": 1}, {"championId": 2}]
+    snapshot = ChampSelectSnapshot(session)
+
+    assert snapshot.champion_id == 103
+    assert snapshot.bench_champion_ids == [1, 2]
@@ -0,0 +1,149 @@
+import threading
+
+from conftest import request_count
+
+
+def make_rune_page(name: str, perk_ids, active: bool = False) -> dict:
+    """
+    Returns a rune page in the format built by puppy
+
+    name - name of the rune page
+    perk_ids - ids of the selected runes
+    active - whether the rune page should be the current one
+    """
+
+    return {
+        "name": name,
+        "current": active,
+        "isActive": active,
+        "isEditable": True,
+        "primaryStyleId": 8000,
+        "subStyleId": 8100,
+        "selectedPerkIds": list(perk_ids),
+    }
+
+
+def make_item_set(title: str, item_ids) -> dict:
+    """
+    Returns an item set in the format built by puppy
+
+    title - title of the item set
+    item_ids - ids of the items in its only block
+    """
+
+    return {
+        "title": title,
+        "associatedChampions": [103],
+        "associatedMaps": [11],
+        "blocks": [
+            {"type": "Core", "items": [{"id": i, "count": 1} for i in item_ids]}
+        ],
+    }
+
+
+def count_writes(fake_lcu) -> int:
+    """
+    Returns the number of requests that changed rune pages
+    """
+
+    return sum(
+        count
+        for route, count in fake_lcu.state.request_counts.items()
+        if route.startswith(("POST /lol-perks", "PUT /lol-perks", "DELETE /lol-perks"))
+    )
+
+
+def test_champ_select_flow(fake_lcu, lcu_interface):
+    from puppy.static import GAMEFLOW_PHASE
+
+    fake_lcu.state.set_phase("Lobby")
+    assert lcu_interface.get_gameflow_phase() == GAMEFLOW_PHASE.LOBBY
+
+    threading.Timer(0.05, fake_lcu.state.start_champ_select, ["middle"]).start()
+    lcu_interface.wait_for_champ_select()
+    assert lcu_interface.get_current_queue().lcu_queue_name == "Summoner's Rift"
+    assert lcu_interface.get_assigned_role().display_role_name == "Middle"
+
+    threading.Timer(0.05, fake_lcu.state.lock_champion, [103]).start()
+    lcu_interface.wait_for_champion_lock()
+    snapshot = lcu_interface.get_champ_select_snapshot()
+    assert snapshot.champion_id == 103
+    assert snapshot.summoner_id == 1234
+
+    fake_lcu.state.end_champ_select()
+    assert lcu_interface.get_champ_select_snapshot() is None
+    # champ select is read from the session alone
+    assert request_count(fake_lcu, "GET", r"/lol-champ-select/v1/current-champion") == 0
+    assert lcu_interface.scheduler.errors == 0
+
+
+def test_sync_rune_pages_only_writes_changes(fake_lcu, lcu_interface):
+    rune_pages = [
+        make_rune_page("Middle", [8112, 8126], active=True),
+        make_rune_page("Top", [8010, 9111]),
+    ]
+
+    lcu_interface.sync_rune_pages(rune_pages)
+    assert request_count(fake_lcu, "POST", r"/lol-perks/v1/pages") == 2
+    assert request_count(fake_lcu, "PUT", r"/lol-perks/v1/currentpage") == 1
+    assert lcu_interface.get_current_rune_page()["name"] == "Middle"
+
+    # unchanged pages are not written again
+    writes = count_writes(fake_lcu)
+    lcu_interface.sync_rune_pages(rune_pages)
+    assert count_writes(fake_lcu) == writes
+
+    # changed pages are updated in place
+    rune_pages[1] = make_rune_page("Top", [8010, 9104])
+    lcu_interface.sync_rune_pages(rune_pages)
+    assert request_count(fake_lcu, "PUT", r"/lol-perks/v1/pages/(\d+)") == 1
+    assert request_count(fake_lcu, "POST", r"/lol-perks/v1/pages") == 2
+
+    # leftover pages are deleted, pages that are not for a role are kept
+    lcu_interface.sync_rune_pages(rune_pages[:1])
+    assert request_count(fake_lcu, "DELETE", r"/lol-perks/v1/pages/(\d+)") == 1
+    names = [page["name"] for page in lcu_interface.get_rune_pages()]
+    assert names == ["Custom", "Default", "Middle"]
+
+
+def test_current_rune_page_is_not_stale_after_sync(fake_lcu, lcu_interface):
+    # as if pushed data were available, which is kept until an event changes it
+    lcu_interface.events.connected = True
+    assert lcu_interface.get_current_rune_page()["name"] == "Custom"
+
+    lcu_interface.sync_rune_pages([make_rune_page("Middle", [8112], active=True)])
+
+    assert lcu_interface.get_current_rune_page()["name"] == "Middle"
+
+
+def test_item_sets_written_once(fake_lcu, lcu_interface):
+    from puppy import put_role_item_sets
+
+    item_sets_data = lcu_interface.get_item_sets_data()
+    put_role_item_sets(
+        lcu_interface, item_sets_data, [make_item_set("Ahri Mid", [3089])]
+    )
+    item_sets_data = lcu_interface.get_item_sets_data()
+    assert [item_set["title"] for item_set in item_sets_data["itemSets"]] == [
+        "Ahri Mid"
+    ]
+
+    # the same item sets are not written again
+    put_role_item_sets(
+        lcu_interface, item_sets_data, [make_item_set("Ahri Mid", [3089])]
+    )
+    path = r"/lol-item-sets/v1/item-sets/(\d+)/sets"
+    assert request_count(fake_lcu, "PUT", path) == 1
+
+    # the item set for a role is replaced
+    put_role_item_sets(
+        lcu_interface, item_sets_data, [make_item_set("Ahri Mid", [3157])]
+    )
+    assert request_count(fake_lcu, "PUT", path) == 2
+    item_sets = fake_lcu.state.item_sets["1234"]["itemSets"]
+    assert [item_set["blocks"][0]["items"][0]["id"] for item_set in item_sets] == [
+        3157
+    ]
+
+    # the summoner id is only requested once
+    assert request_count(fake_lcu, "GET", r"/lol-summoner/v1/current-summoner") == 1
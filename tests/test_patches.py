@@ -0,0 +1,33 @@
+import pytest
+
+from conftest import request_count
+
+
+@pytest.fixture
+def patches(lcu):
+    """
+    Patches reading the current patch from the fake lcu
+    """
+
+    from puppy.apis import Patches
+
+    Patches.use_client(lcu)
+    yield Patches
+    Patches.lcu = None
+
+
+def test_client_patch_read_once_per_client(fake_lcu, lcu, patches):
+    path = r"/lol-patch/v1/game-version"
+
+    # a version that cannot be read is not requested again
+    assert patches.get_client_patch() is None
+    assert patches.get_client_patch() is None
+    assert request_count(fake_lcu, "GET", path) == 1
+
+    # until the client restarts
+    fake_lcu.state.set_game_version("13.1.486.1234")
+    fake_lcu.server.key = lcu.auth.key = "restarted-key"
+    lcu.use_auth()
+    assert patches.get_client_patch() == "13.1"
+    assert patches.get_client_patch() == "13.1"
+    assert request_count(fake_lcu, "GET", path) == 2
@@ -0,0 +1,39 @@
+def test_poll_time_depends_on_phase_and_errors(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    from puppy.poll_scheduler import PollScheduler
+    from puppy.static import GAMEFLOW_PHASE
+
+    scheduler = PollScheduler(idle=2, champ_select=0.5, other=1, max_backoff=8)
+    assert scheduler.get_poll_time() == 2
+
+    scheduler.set_phase(GAMEFLOW_PHASE.CHAMP_SELECT)
+    assert scheduler.get_poll_time() == 0.5
+    scheduler.set_phase(GAMEFLOW_PHASE.IN_PROGRESS)
+    assert scheduler.get_poll_time() == 1
+
+    # doubled for every consecutive error, up to max_backoff
+    poll_times = []
+    for _ in range(5):
+        scheduler.record_error()
+        poll_times.append(scheduler.get_poll_time())
+    assert poll_times == [2, 4, 8, 8, 8]
+
+    scheduler.record_success()
+    assert scheduler.get_poll_time() == 1
+
+
+def test_requests_counted_per_phase(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    from puppy.poll_scheduler import PollScheduler
+    from puppy.static import GAMEFLOW_PHASE
+
+    scheduler = PollScheduler(idle=2, champ_select=0.5, other=1, max_backoff=8)
+    scheduler.record_requests(3)
+    scheduler.set_phase(GAMEFLOW_PHASE.CHAMP_SELECT)
+    scheduler.record_requests(2)
+    scheduler.record_requests(4)
+
+    assert scheduler.request_counts == {
+        GAMEFLOW_PHASE.NONE: 3,
+        GAMEFLOW_PHASE.CHAMP_SELECT: 6,
+    }
@@ -0,0 +1,78 @@
+import gc
+import tracemalloc
+from pathlib import Path
+
+FIXTURE_DIRECTORY = Path(__file__).parent / "fixtures" / "ddragon"
+# memory that loaded static data may keep (bytes), the whole parsed
+# fixture payloads take about 7 times as much
+STATIC_DATA_CEILING = 96 * 1024
+
+
+def unload(cls):
+    """
+    Forgets the static data loaded by a static data class
+    """
+
+    from puppy.apis.ddragon.lazy import LazyAttribute
+
+    for attribute in vars(cls).values():
+        if isinstance(attribute, LazyAttribute):
+            attribute.loaded = False
+            attribute.value = None
+        function = getattr(attribute, "__func__", None)
+        if hasattr(function, "cache_clear"):
+            function.cache_clear()
+
+
+def test_static_data_memory_ceiling(tmp_path, monkeypatch):
+    # importing puppy creates a config file in the working directory
+    monkeypatch.chdir(tmp_path)
+    from puppy.apis.ddragon import Champions, Item, Map, Runes, Summoner
+    from puppy.apis.ddragon.static_data import (
+        DdragonSource,
+        StaticData,
+        StaticDataSourceAbc,
+    )
+    from puppy.apis.json_codec import loads
+
+    class FixtureSource(StaticDataSourceAbc):
+        def get(self, filename, project):
+            return project(loads((FIXTURE_DIRECTORY / filename).read_bytes()))
+
+    # memory taken by keeping the whole parsed payloads
+    gc.collect()
+    tracemalloc.start()
+    payloads = [
+        loads(path.read_bytes()) for path in sorted(FIXTURE_DIRECTORY.glob("*.json"))
+    ]
+    raw, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del payloads
+
+    classes = (Champions, Item, Map, Runes, Summoner)
+    for cls in classes:
+        unload(cls)
+    StaticData.use(FixtureSource())
+    gc.collect()
+    tracemalloc.start()
+    try:
+        # everything looked up during champ select
+        Champions.names_by_id
+        Champions.alternate_names_by_id
+        Champions.ids_by_name
+        Item.name_id
+        Map.maps
+        Runes.rune_positions
+        Runes.rune_ids_by_key
+        Summoner.summoners
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        StaticData.use(DdragonSource())
+        for cls in classes:
+            unload(cls)
+
+    assert retained <= STATIC_DATA_CEILING, f"{retained} bytes retained"
+    # the raw payloads are dropped once they are projected
+    assert retained * 4 <= raw, f"{retained} bytes retained of {raw}"
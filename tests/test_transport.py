@@ -0,0 +1,149 @@
+import threading
+import time
+
+import pytest
+
+from conftest import request_count
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """
+    Retries requests without waiting
+    """
+
+    from puppy.apis.client import transport
+
+    monkeypatch.setattr(transport, "RETRY_BACKOFF", 0)
+
+
+def add_route(fake_lcu, method: str, path: str, statuses):
+    """
+    Adds a route to the fake lcu that responds with statuses in order,
+        repeating the last one
+
+    fake_lcu - fake lcu to add the route to
+    method - http method
+    path - path regex of the route
+    statuses - status codes to respond with
+    """
+
+    statuses = list(statuses)
+
+    def handler(body):
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        return status, {"status": status}
+
+    fake_lcu.state.routes.insert(0, (method, path, handler))
+
+
+def test_retries_idempotent_requests(fake_lcu, lcu, no_backoff):
+    add_route(fake_lcu, "GET", r"/flaky", [503, 503, 200])
+
+    r = lcu.get(["flaky"])
+
+    assert r.status_code == 200
+    assert request_count(fake_lcu, "GET", r"/flaky") == 3
+    assert lcu.transport.get_counters()["retries"] == 2
+
+
+def test_gives_up_after_max_retries(fake_lcu, lcu, no_backoff):
+    add_route(fake_lcu, "GET", r"/down", [503])
+
+    r = lcu.get(["down"])
+
+    assert r.status_code == 503
+    assert request_count(fake_lcu, "GET", r"/down") == lcu.transport.max_retries + 1
+
+
+def test_does_not_retry_posts(fake_lcu, lcu, no_backoff):
+    add_route(fake_lcu, "POST", r"/flaky", [503, 200])
+
+    r = lcu.post(["flaky"], data={})
+
+    assert r.status_code == 503
+    assert request_count(fake_lcu, "POST", r"/flaky") == 1
+
+
+def test_timeout_raises_lcu_unavailable(fake_lcu, lcu):
+    from puppy.apis.client.exceptions import LcuUnavailableError
+
+    def slow(body):
+        time.sleep(0.5)
+        return 200, "Lobby"
+
+    fake_lcu.state.routes.insert(0, ("GET", r"/slow", slow))
+    lcu.transport.timeout = (1, 0.1)
+    lcu.transport.max_retries = 0
+
+    with pytest.raises(LcuUnavailableError):
+        lcu.get(["slow"])
+    assert lcu.transport.get_counters()["timeouts"] == 1
+
+
+def test_stopped_client_raises_lcu_unavailable(fake_lcu, lcu_interface, no_backoff):
+    from puppy.apis.client.exceptions import LcuUnavailableError
+
+    fake_lcu.state.start_champ_select("middle")
+    assert lcu_interface.get_champ_select_snapshot() is not None
+
+    fake_lcu.stop()
+    # connections kept alive would still be served
+    lcu_interface.lcu.session.close()
+
+    with pytest.raises(LcuUnavailableError):
+        lcu_interface.get_champ_select_snapshot()
+
+
+def test_circuit_breaker_fails_fast(fake_lcu, lcu):
+    from puppy.apis.client.exceptions import LcuUnavailableError
+    from puppy.apis.client.transport import FAILURE_THRESHOLD
+
+    fake_lcu.stop()
+    lcu.session.close()
+    lcu.transport.max_retries = 0
+
+    for _ in range(FAILURE_THRESHOLD):
+        with pytest.raises(LcuUnavailableError):
+            lcu.get(["lol-gameflow", "v1", "gameflow-phase"])
+    with pytest.raises(LcuUnavailableError, match="unreachable"):
+        lcu.get(["lol-gameflow", "v1", "gameflow-phase"])
+
+    counters = lcu.transport.get_counters()
+    assert counters["circuit_opens"] == 1
+    assert counters["rejected"] == 1
+    assert counters["requests"] == FAILURE_THRESHOLD
+
+
+def test_reauthenticates_after_restart(fake_lcu, lcu, monkeypatch):
+    from puppy.fake_lcu import FakeLcu, FakeLcuState
+
+    restarted = FakeLcu(key="restarted-key", state=FakeLcuState(summoner_id=5678))
+    restarted.start()
+    try:
+        assert lcu.get_summoner_id() == 1234
+        lcu.set_summoner_id(None)
+        fake_lcu.stop()
+        lcu.session.close()
+
+        def refresh():
+            if lcu.auth.port == str(restarted.port):
+                return False
+            lcu.auth.port, lcu.auth.key = str(restarted.port), restarted.key
+            return True
+
+        monkeypatch.setattr(lcu.auth, "refresh", refresh)
+
+        # reauthenticating invalidates the summoner id while it is requested
+        summoner_ids = []
+        thread = threading.Thread(
+            target=lambda: summoner_ids.append(lcu.get_summoner_id()), daemon=True
+        )
+        thread.start()
+        thread.join(10)
+        assert not thread.is_alive(), "deadlocked"
+        assert summoner_ids == [5678]
+        assert lcu.transport.get_counters()["reconnects"] == 1
+        assert lcu.get_summoner_id() == 5678
+    finally:
+        restarted.stop()